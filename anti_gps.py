@@ -4,23 +4,86 @@ Anti GPS System - GPS Signal Detection and Privacy Protection
 A comprehensive system for detecting, analyzing, and protecting against GPS tracking.
 """
 
-import time
+import logging
 import random
+import secrets
 import math
-import threading
 from datetime import datetime
-import json
 import os
+import sys
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from log_utils import json_line
+
+# Library output goes through logging and is silent unless a handler is installed
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+@dataclass(frozen=True, slots=True)
+class Signal:
+    """A single detected GPS signal reading."""
+    frequency: str
+    strength: float
+    quality: float
+    frequency_mhz: float = 0.0
+    timestamp: str = ""
+    
+    @property
+    def threat_level(self):
+        """Per-signal threat classification derived from strength."""
+        return "high" if self.strength > 0.7 else "medium"
+
+def _classify_threat(total_strength, avg_quality):
+    """Map aggregate signal strength and mean quality to a threat level."""
+    if total_strength > 2.0 and avg_quality > 0.8:
+        return "critical"
+    elif total_strength > 1.5 and avg_quality > 0.7:
+        return "high"
+    elif total_strength > 1.0:
+        return "medium"
+    else:
+        return "low"
+
+def _jamming_core(n, rng):
+    """Draw n jamming powers and their success flags in one batch."""
+    uniform = rng.uniform
+    powers = [uniform(0.6, 0.95) for _ in range(n)]
+    return powers, [p > 0.7 for p in powers]
 
 class AntiGPSSystem:
+    # Read-only decoy locations used by location_spoofing
+    _FAKE_LOCATIONS = (
+        MappingProxyType({"lat": 40.7128, "lon": -74.0060, "name": "New York"}),
+        MappingProxyType({"lat": 51.5074, "lon": -0.1278, "name": "London"}),
+        MappingProxyType({"lat": 35.6762, "lon": 139.6503, "name": "Tokyo"}),
+        MappingProxyType({"lat": -33.8688, "lon": 151.2093, "name": "Sydney"}),
+        MappingProxyType({"lat": 55.7558, "lon": 37.6176, "name": "Moscow"})
+    )
+    
+    # Frequency hopping patterns (MHz) used by frequency_hopping
+    _HOP_PATTERNS = (
+        (1575.42, 1227.60, 1176.45),  # GPS frequencies
+        (2400.0, 5800.0, 900.0),      # Alternative frequencies
+        (433.0, 868.0, 2400.0)        # ISM bands
+    )
+    
+    # Number of recent signals kept for status reporting
+    HISTORY_SIZE = 1024
+    
     def __init__(self):
         """Initialize the Anti GPS System."""
         self.is_active = False
         self.detection_mode = "passive"  # passive, active, aggressive
         self.protection_level = "medium"  # low, medium, high, maximum
-        self.gps_signals_detected = []
+        self.gps_signals_detected = deque(maxlen=self.HISTORY_SIZE)  # rolling window of recent signals
+        # Column views of the same window for the history threat reduction
+        self._strength_history = deque(maxlen=self.HISTORY_SIZE)
+        self._quality_history = deque(maxlen=self.HISTORY_SIZE)
         self.jamming_active = False
         self.log_file = "anti_gps_log.txt"
+        self._log_fp = None  # opened on first log_activity call
+        self._rng = random.Random()  # one generator shared by all simulations
         
         # GPS signal characteristics
         self.gps_frequencies = {
@@ -29,6 +92,9 @@ class AntiGPSSystem:
             "L5": 1176.45   # MHz
         }
         
+        # (name, MHz) pairs scanned on every detection pass
+        self._frequency_bands = tuple(self.gps_frequencies.items())
+        
         # Protection methods
         self.protection_methods = {
             "low": ["signal_detection", "location_spoofing"],
@@ -37,33 +103,46 @@ class AntiGPSSystem:
             "maximum": ["signal_detection", "location_spoofing", "signal_jamming", "frequency_hopping", "encryption"]
         }
         
-        print("🛡️ Anti GPS System Initialized")
-        print("=" * 50)
+        # Per-level (name, handler) dispatch table built once from protection_methods;
+        # every handler takes (signals, timestamp), whether or not it uses the signals
+        protection_handlers = {
+            "location_spoofing": lambda signals, timestamp: self.location_spoofing(timestamp),
+            "signal_jamming": self.signal_jamming,
+            "frequency_hopping": lambda signals, timestamp: self.frequency_hopping(timestamp),
+            "encryption": lambda signals, timestamp: self.encrypt_location_data(timestamp)
+        }
+        self._protection_dispatch = {
+            level: tuple((name, protection_handlers[name])
+                         for name in methods if name in protection_handlers)
+            for level, methods in self.protection_methods.items()
+        }
+        
+        log.info("🛡️ Anti GPS System Initialized")
+        log.info("=" * 50)
     
-    def detect_gps_signals(self):
+    def detect_gps_signals(self, timestamp=None):
         """Simulate GPS signal detection."""
-        print("🔍 Scanning for GPS signals...")
-        
-        # Simulate signal detection
-        signals = []
-        for freq_name, freq in self.gps_frequencies.items():
-            # Simulate signal strength and quality
-            signal_strength = random.uniform(0.1, 1.0)
-            signal_quality = random.uniform(0.5, 0.95)
-            
-            if signal_strength > 0.3:  # Detectable signal
-                signal_info = {
-                    "frequency": freq_name,
-                    "frequency_mhz": freq,
-                    "strength": signal_strength,
-                    "quality": signal_quality,
-                    "timestamp": datetime.now().isoformat(),
-                    "threat_level": "high" if signal_strength > 0.7 else "medium"
-                }
-                signals.append(signal_info)
-                print(f"⚠️  Detected {freq_name} signal: {signal_strength:.2f} strength")
+        log.info("🔍 Scanning for GPS signals...")
+        
+        # Draw strength/quality for every band in one pass, then build
+        # records only for the bands that are actually detectable
+        uniform = self._rng.uniform
+        readings = [(freq_name, freq, uniform(0.1, 1.0), uniform(0.5, 0.95))
+                    for freq_name, freq in self._frequency_bands]
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
+        signals = [
+            Signal(freq_name, signal_strength, signal_quality, freq, timestamp)
+            for freq_name, freq, signal_strength, signal_quality in readings
+            if signal_strength > 0.3  # Detectable signal
+        ]
+        for signal in signals:
+            log.info("⚠️  Detected %s signal: %.2f strength", signal.frequency, signal.strength)
         
         self.gps_signals_detected.extend(signals)
+        self._strength_history.extend(s.strength for s in signals)
+        self._quality_history.extend(s.quality for s in signals)
         return signals
     
     def analyze_threat_level(self, signals):
@@ -71,189 +150,207 @@ class AntiGPSSystem:
         if not signals:
             return "none"
         
-        total_strength = sum(s["strength"] for s in signals)
-        avg_quality = sum(s["quality"] for s in signals) / len(signals)
+        # Single fused pass over strength and quality
+        total_strength = 0.0
+        total_quality = 0.0
+        for signal in signals:
+            total_strength += signal.strength
+            total_quality += signal.quality
+        return _classify_threat(total_strength, total_quality / len(signals))
+    
+    def history_threat_level(self):
+        """Threat level over the rolling signal history, reduced column-wise."""
+        if not self._strength_history:
+            return "none"
         
-        if total_strength > 2.0 and avg_quality > 0.8:
-            return "critical"
-        elif total_strength > 1.5 and avg_quality > 0.7:
-            return "high"
-        elif total_strength > 1.0:
-            return "medium"
-        else:
-            return "low"
+        return _classify_threat(sum(self._strength_history),
+                                sum(self._quality_history) / len(self._quality_history))
     
-    def location_spoofing(self):
+    def location_spoofing(self, timestamp=None):
         """Spoof GPS location to protect privacy."""
-        print("📍 Activating location spoofing...")
-        
-        # Generate fake coordinates
-        fake_locations = [
-            {"lat": 40.7128, "lon": -74.0060, "name": "New York"},
-            {"lat": 51.5074, "lon": -0.1278, "name": "London"},
-            {"lat": 35.6762, "lon": 139.6503, "name": "Tokyo"},
-            {"lat": -33.8688, "lon": 151.2093, "name": "Sydney"},
-            {"lat": 55.7558, "lon": 37.6176, "name": "Moscow"}
-        ]
+        log.info("📍 Activating location spoofing...")
+        
+        # Randomly select a fake location by index
+        fake_location = self._FAKE_LOCATIONS[self._rng.randrange(len(self._FAKE_LOCATIONS))]
         
-        # Randomly select a fake location
-        fake_location = random.choice(fake_locations)
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
         spoof_data = {
             "original_location": "PROTECTED",
             "spoofed_location": fake_location,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "method": "location_spoofing"
         }
         
-        print(f"🎭 Location spoofed to: {fake_location['name']}")
+        log.info("🎭 Location spoofed to: %s", fake_location["name"])
         return spoof_data
     
-    def signal_jamming(self, signals):
+    def signal_jamming(self, signals, timestamp=None):
         """Simulate GPS signal jamming."""
         if not signals:
             return False
         
-        print("📡 Activating signal jamming...")
+        log.info("📡 Activating signal jamming...")
+        
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
+        # Simulate jamming effectiveness for all signals at once
+        powers, successes = _jamming_core(len(signals), self._rng)
         
         jamming_results = []
-        for signal in signals:
-            # Simulate jamming effectiveness
-            jamming_power = random.uniform(0.6, 0.95)
-            jamming_success = jamming_power > 0.7
-            
+        for signal, jamming_power, jamming_success in zip(signals, powers, successes):
             jamming_result = {
-                "frequency": signal["frequency"],
+                "frequency": signal.frequency,
                 "jamming_power": jamming_power,
                 "success": jamming_success,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             jamming_results.append(jamming_result)
             
             status = "✅" if jamming_success else "❌"
-            print(f"{status} Jamming {signal['frequency']}: {jamming_power:.2f} power")
+            log.info("%s Jamming %s: %.2f power", status, signal.frequency, jamming_power)
         
-        self.jamming_active = any(r["success"] for r in jamming_results)
+        self.jamming_active = any(successes)
         return jamming_results
     
-    def frequency_hopping(self):
+    def frequency_hopping(self, timestamp=None):
         """Implement frequency hopping to avoid detection."""
-        print("🔄 Activating frequency hopping...")
+        log.info("🔄 Activating frequency hopping...")
         
         # Simulate frequency hopping patterns
-        hop_patterns = [
-            [1575.42, 1227.60, 1176.45],  # GPS frequencies
-            [2400.0, 5800.0, 900.0],      # Alternative frequencies
-            [433.0, 868.0, 2400.0]        # ISM bands
-        ]
+        current_pattern = self._HOP_PATTERNS[self._rng.randrange(len(self._HOP_PATTERNS))]
+        hop_interval = self._rng.uniform(0.1, 0.5)  # seconds
         
-        current_pattern = random.choice(hop_patterns)
-        hop_interval = random.uniform(0.1, 0.5)  # seconds
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
         hopping_data = {
             "pattern": current_pattern,
             "interval": hop_interval,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "method": "frequency_hopping"
         }
         
-        print(f"🔄 Hopping pattern: {len(current_pattern)} frequencies, {hop_interval:.2f}s interval")
+        log.info("🔄 Hopping pattern: %d frequencies, %.2fs interval", len(current_pattern), hop_interval)
         return hopping_data
     
-    def encrypt_location_data(self):
+    def encrypt_location_data(self, timestamp=None):
         """Encrypt location data for maximum protection."""
-        print("🔐 Encrypting location data...")
+        log.info("🔐 Encrypting location data...")
         
         # Simulate encryption
-        encryption_key = ''.join(random.choices('0123456789ABCDEF', k=32))
+        encryption_key = secrets.token_hex(16).upper()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         encrypted_data = {
             "encryption_key": encryption_key,
             "algorithm": "AES-256",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "method": "encryption"
         }
         
-        print(f"🔐 Data encrypted with key: {encryption_key[:8]}...")
+        log.info("🔐 Data encrypted with key: %s...", encryption_key[:8])
         return encrypted_data
     
-    def continuous_monitoring(self):
+    async def continuous_monitoring(self):
         """Continuously monitor for GPS signals."""
-        print("🔄 Starting continuous monitoring...")
+        import asyncio  # deferred: only the monitoring loop needs the event loop
+        
+        log.info("🔄 Starting continuous monitoring...")
         self.is_active = True
         
         while self.is_active:
+            # One timestamp shared by every record produced in this scan
+            now = datetime.now().isoformat()
+            
             # Detect signals
-            signals = self.detect_gps_signals()
+            signals = self.detect_gps_signals(now)
             
+            # Assessed once per scan and reused for protection and logging
+            threat_level = self.analyze_threat_level(signals)
             if signals:
-                threat_level = self.analyze_threat_level(signals)
-                print(f"🚨 Threat level: {threat_level.upper()}")
+                log.info("🚨 Threat level: %s", threat_level.upper())
                 
                 # Apply protection based on threat level
                 if threat_level in ["high", "critical"]:
-                    self.apply_protection(signals)
+                    self.apply_protection(signals, now)
                 elif threat_level == "medium":
-                    self.apply_basic_protection(signals)
+                    self.apply_basic_protection(signals, now)
             
             # Log activity
-            self.log_activity(signals)
+            self.log_activity(signals, threat_level, now)
             
             # Wait before next scan
-            time.sleep(2)
+            await asyncio.sleep(2)
     
-    def apply_protection(self, signals):
-        """Apply maximum protection measures."""
-        print("🛡️ Applying maximum protection...")
-        
-        protection_results = {
-            "location_spoofing": self.location_spoofing(),
-            "signal_jamming": self.signal_jamming(signals),
-            "frequency_hopping": self.frequency_hopping(),
-            "encryption": self.encrypt_location_data()
-        }
+    def apply_level_protection(self, level, signals, timestamp=None):
+        """Run every protection method configured for the given level."""
+        protection_results = {}
+        for name, handler in self._protection_dispatch[level]:
+            protection_results[name] = handler(signals, timestamp)
         
         return protection_results
     
-    def apply_basic_protection(self, signals):
+    def apply_protection(self, signals, timestamp=None):
+        """Apply maximum protection measures."""
+        log.info("🛡️ Applying maximum protection...")
+        return self.apply_level_protection("maximum", signals, timestamp)
+    
+    def apply_basic_protection(self, signals, timestamp=None):
         """Apply basic protection measures."""
-        print("🛡️ Applying basic protection...")
-        
-        protection_results = {
-            "location_spoofing": self.location_spoofing(),
-            "signal_jamming": self.signal_jamming(signals)
-        }
-        
-        return protection_results
+        log.info("🛡️ Applying basic protection...")
+        return self.apply_level_protection("medium", signals, timestamp)
     
-    def log_activity(self, signals):
+    def log_activity(self, signals, threat_level=None, timestamp=None):
         """Log all anti-GPS activity."""
+        if threat_level is None:
+            threat_level = self.analyze_threat_level(signals)
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "signals_detected": len(signals),
-            "threat_level": self.analyze_threat_level(signals),
+            "threat_level": threat_level,
             "protection_active": self.jamming_active,
             "detection_mode": self.detection_mode
         }
         
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Keep one unbuffered binary append handle open instead of reopening per scan
+        if self._log_fp is None:
+            self._log_fp = open(self.log_file, "ab", buffering=0)
+        self._log_fp.write(json_line(log_entry))
+    
+    def close(self):
+        """Flush and close the activity log."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+    
+    def reset_settings(self):
+        """Restore the detection mode, protection level and jamming flag a new system starts with."""
+        self.detection_mode = "passive"
+        self.protection_level = "medium"
+        self.jamming_active = False
     
     def set_protection_level(self, level):
         """Set the protection level."""
         if level in self.protection_methods:
             self.protection_level = level
-            print(f"🛡️ Protection level set to: {level.upper()}")
+            log.info("🛡️ Protection level set to: %s", level.upper())
         else:
-            print("❌ Invalid protection level. Use: low, medium, high, maximum")
+            log.warning("❌ Invalid protection level. Use: low, medium, high, maximum")
     
     def set_detection_mode(self, mode):
         """Set the detection mode."""
         valid_modes = ["passive", "active", "aggressive"]
         if mode in valid_modes:
             self.detection_mode = mode
-            print(f"🔍 Detection mode set to: {mode.upper()}")
+            log.info("🔍 Detection mode set to: %s", mode.upper())
         else:
-            print("❌ Invalid detection mode. Use: passive, active, aggressive")
+            log.warning("❌ Invalid detection mode. Use: passive, active, aggressive")
     
     def get_status(self):
         """Get current system status."""
@@ -263,17 +360,19 @@ class AntiGPSSystem:
             "protection_level": self.protection_level,
             "signals_detected": len(self.gps_signals_detected),
             "jamming_active": self.jamming_active,
-            "threat_level": self.analyze_threat_level(self.gps_signals_detected)
+            "threat_level": self.history_threat_level()
         }
         return status
     
     def stop_monitoring(self):
         """Stop continuous monitoring."""
         self.is_active = False
-        print("🛑 Monitoring stopped")
+        log.info("🛑 Monitoring stopped")
 
 def main():
     """Main function to run the Anti GPS System."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("🛡️ ANTI GPS SYSTEM")
     print("=" * 50)
     print("GPS Signal Detection and Privacy Protection")
@@ -292,18 +391,14 @@ def main():
     print("Press Ctrl+C to stop")
     
     try:
-        # Start continuous monitoring in a separate thread
-        monitor_thread = threading.Thread(target=anti_gps.continuous_monitoring)
-        monitor_thread.daemon = True
-        monitor_thread.start()
-        
-        # Keep main thread alive
-        while True:
-            time.sleep(1)
-            
+        # Run continuous monitoring on the asyncio event loop
+        import asyncio
+        asyncio.run(anti_gps.continuous_monitoring())
+        
     except KeyboardInterrupt:
         print("\n🛑 Stopping Anti GPS System...")
         anti_gps.stop_monitoring()
+        anti_gps.close()
         
         # Show final status
         status = anti_gps.get_status()
@@ -6,9 +6,8 @@ A graphical interface for the Anti GPS System with real-time monitoring.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
+import time
 from datetime import datetime
 from anti_gps import AntiGPSSystem
 
@@ -21,8 +20,12 @@ class AntiGPSGUI:
         
         # Initialize the anti GPS system
         self.anti_gps = AntiGPSSystem()
-        self.monitoring_thread = None
         self.is_monitoring = False
+        self.monitoring_job = None  # pending after() id of the next scan
+        
+        # Log lines waiting to be flushed into the log widget in one batch
+        self.pending_log_lines = []
+        self.log_flush_job = None
         
         # Create GUI elements
         self.setup_gui()
@@ -127,10 +130,8 @@ class AntiGPSGUI:
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             
-            # Start monitoring in a separate thread
-            self.monitoring_thread = threading.Thread(target=self.monitoring_loop)
-            self.monitoring_thread.daemon = True
-            self.monitoring_thread.start()
+            # Drive scans from the Tk event loop
+            self.monitoring_job = self.root.after(0, self.monitoring_tick)
             
             self.log_message("🚀 Monitoring started")
             self.update_status_display()
@@ -140,40 +141,54 @@ class AntiGPSGUI:
         if self.is_monitoring:
             self.is_monitoring = False
             self.anti_gps.stop_monitoring()
+            
+            # Cancel the pending scan so a quick restart can't run two scan chains
+            if self.monitoring_job is not None:
+                self.root.after_cancel(self.monitoring_job)
+                self.monitoring_job = None
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
             
             self.log_message("🛑 Monitoring stopped")
             self.update_status_display()
             
-    def monitoring_loop(self):
-        """Main monitoring loop."""
-        while self.is_monitoring:
-            try:
-                # Detect GPS signals
-                signals = self.anti_gps.detect_gps_signals()
-                
-                if signals:
-                    threat_level = self.anti_gps.analyze_threat_level(signals)
-                    
-                    # Update GUI with signal information
-                    self.root.after(0, self.update_signal_display, signals, threat_level)
-                    
-                    # Apply protection based on threat level
-                    if threat_level in ["high", "critical"]:
-                        self.root.after(0, self.apply_protection, signals)
-                    elif threat_level == "medium":
-                        self.root.after(0, self.apply_basic_protection, signals)
-                
-                # Log activity
-                self.anti_gps.log_activity(signals)
+    def monitoring_tick(self):
+        """Run one monitoring scan and schedule the next one."""
+        self.monitoring_job = None
+        if not self.is_monitoring:
+            return
+        
+        try:
+            # One timestamp shared by every record produced in this scan
+            now = datetime.now().isoformat()
+            
+            # Detect GPS signals
+            signals = self.anti_gps.detect_gps_signals(now)
+            
+            # Assessed once per scan and reused for protection and logging
+            threat_level = self.anti_gps.analyze_threat_level(signals)
+            if signals:
                 
-                # Wait before next scan
-                time.sleep(3)
+                # Update GUI with signal information
+                self.update_signal_display(signals, threat_level)
                 
-            except Exception as e:
-                self.root.after(0, self.log_message, f"Error: {str(e)}")
-                time.sleep(1)
+                # Apply protection based on threat level
+                if threat_level in ["high", "critical"]:
+                    self.apply_protection(signals, now)
+                elif threat_level == "medium":
+                    self.apply_basic_protection(signals, now)
+            
+            # Log activity
+            self.anti_gps.log_activity(signals, threat_level, now)
+            
+            # Wait before next scan
+            delay = 3000
+            
+        except Exception as e:
+            self.log_message(f"Error: {str(e)}")
+            delay = 1000
+        
+        self.monitoring_job = self.root.after(delay, self.monitoring_tick)
                 
     def update_signal_display(self, signals, threat_level):
         """Update the signal display."""
@@ -184,43 +199,43 @@ class AntiGPSGUI:
         status += f"🔍 Detection Mode: {self.anti_gps.detection_mode.upper()}\n\n"
         
         for signal in signals:
-            status += f"⚠️  {signal['frequency']}: {signal['strength']:.2f} strength\n"
+            status += f"⚠️  {signal.frequency}: {signal.strength:.2f} strength\n"
         
         self.status_text.delete(1.0, tk.END)
         self.status_text.insert(tk.END, status)
         
-    def apply_protection(self, signals):
+    def apply_protection(self, signals, timestamp=None):
         """Apply maximum protection."""
         self.log_message("🛡️ Applying maximum protection...")
         
         # Location spoofing
-        spoof_result = self.anti_gps.location_spoofing()
+        spoof_result = self.anti_gps.location_spoofing(timestamp)
         self.log_message(f"📍 Location spoofed to: {spoof_result['spoofed_location']['name']}")
         
         # Signal jamming
-        jamming_results = self.anti_gps.signal_jamming(signals)
+        jamming_results = self.anti_gps.signal_jamming(signals, timestamp)
         for result in jamming_results:
             status = "✅" if result["success"] else "❌"
             self.log_message(f"{status} Jamming {result['frequency']}: {result['jamming_power']:.2f} power")
         
         # Frequency hopping
-        hopping_result = self.anti_gps.frequency_hopping()
+        hopping_result = self.anti_gps.frequency_hopping(timestamp)
         self.log_message(f"🔄 Frequency hopping activated")
         
         # Encryption
-        encrypt_result = self.anti_gps.encrypt_location_data()
+        encrypt_result = self.anti_gps.encrypt_location_data(timestamp)
         self.log_message(f"🔐 Location data encrypted")
         
-    def apply_basic_protection(self, signals):
+    def apply_basic_protection(self, signals, timestamp=None):
         """Apply basic protection."""
         self.log_message("🛡️ Applying basic protection...")
         
         # Location spoofing
-        spoof_result = self.anti_gps.location_spoofing()
+        spoof_result = self.anti_gps.location_spoofing(timestamp)
         self.log_message(f"📍 Location spoofed to: {spoof_result['spoofed_location']['name']}")
         
         # Signal jamming
-        jamming_results = self.anti_gps.signal_jamming(signals)
+        jamming_results = self.anti_gps.signal_jamming(signals, timestamp)
         for result in jamming_results:
             status = "✅" if result["success"] else "❌"
             self.log_message(f"{status} Jamming {result['frequency']}: {result['jamming_power']:.2f} power")
@@ -259,24 +274,32 @@ class AntiGPSGUI:
         self.status_text.insert(tk.END, status_display)
         
     def log_message(self, message):
-        """Add a message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        """Queue a message for the log; queued lines are flushed in batches."""
+        timestamp = time.strftime("%H:%M:%S")
+        self.pending_log_lines.append(f"[{timestamp}] {message}\n")
+        
+        if self.log_flush_job is None:
+            self.log_flush_job = self.root.after(100, self.flush_log)
+    
+    def flush_log(self):
+        """Insert all queued log lines and trim the log to the last 100 lines."""
+        self.log_flush_job = None
+        self.log_text.insert(tk.END, ''.join(self.pending_log_lines))
+        self.pending_log_lines.clear()
+        
+        # Keep only last 100 lines, trimming by Tk line index
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > 100:
+            self.log_text.delete('1.0', f'{line_count - 100}.0')
         
-        self.log_text.insert(tk.END, log_entry)
         self.log_text.see(tk.END)
-        
-        # Keep only last 100 lines
-        lines = self.log_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 100:
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, '\n'.join(lines[-100:]))
 
 def main():
     """Main function to run the GUI."""
     root = tk.Tk()
     app = AntiGPSGUI(root)
     root.mainloop()
+    app.anti_gps.close()
 
 if __name__ == "__main__":
     main()
@@ -6,15 +6,28 @@ Interactive demonstration of GPS signal detection and privacy protection.
 
 import time
 import random
+import logging
+import sys
 from datetime import datetime
-from anti_gps import AntiGPSSystem
+from anti_gps import AntiGPSSystem, Signal
 
-def demo_gps_detection():
+# Shared by every demo so the system is only constructed once per session
+_SYSTEM = None
+
+def _get_system():
+    """Return the demo's AntiGPSSystem, creating it on first use."""
+    global _SYSTEM
+    if _SYSTEM is None:
+        _SYSTEM = AntiGPSSystem()
+    return _SYSTEM
+
+def demo_gps_detection(anti_gps=None):
     """Demonstrate GPS signal detection capabilities."""
     print("🔍 GPS Signal Detection Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     print("Scanning for GPS signals...")
     for i in range(5):
@@ -23,7 +36,7 @@ def demo_gps_detection():
         if signals:
             print(f"\n📡 Scan {i+1}: {len(signals)} signals detected")
             for signal in signals:
-                print(f"  ⚠️  {signal['frequency']}: {signal['strength']:.2f} strength")
+                print(f"  ⚠️  {signal.frequency}: {signal.strength:.2f} strength")
             
             threat_level = anti_gps.analyze_threat_level(signals)
             print(f"  🚨 Threat Level: {threat_level.upper()}")
@@ -34,12 +47,13 @@ def demo_gps_detection():
     
     print("\n✅ GPS Detection Demo Complete")
 
-def demo_location_spoofing():
+def demo_location_spoofing(anti_gps=None):
     """Demonstrate location spoofing capabilities."""
     print("\n📍 Location Spoofing Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     print("Generating fake locations...")
     for i in range(3):
@@ -54,18 +68,19 @@ def demo_location_spoofing():
     
     print("\n✅ Location Spoofing Demo Complete")
 
-def demo_signal_jamming():
+def demo_signal_jamming(anti_gps=None):
     """Demonstrate signal jamming capabilities."""
     print("\n📡 Signal Jamming Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     # Create sample signals
     sample_signals = [
-        {"frequency": "L1", "strength": 0.8, "quality": 0.9},
-        {"frequency": "L2", "strength": 0.6, "quality": 0.8},
-        {"frequency": "L5", "strength": 0.7, "quality": 0.85}
+        Signal("L1", strength=0.8, quality=0.9),
+        Signal("L2", strength=0.6, quality=0.8),
+        Signal("L5", strength=0.7, quality=0.85)
     ]
     
     print("Jamming detected GPS signals...")
@@ -77,12 +92,13 @@ def demo_signal_jamming():
     
     print("\n✅ Signal Jamming Demo Complete")
 
-def demo_frequency_hopping():
+def demo_frequency_hopping(anti_gps=None):
     """Demonstrate frequency hopping capabilities."""
     print("\n🔄 Frequency Hopping Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     print("Activating frequency hopping patterns...")
     for i in range(3):
@@ -97,12 +113,13 @@ def demo_frequency_hopping():
     
     print("\n✅ Frequency Hopping Demo Complete")
 
-def demo_encryption():
+def demo_encryption(anti_gps=None):
     """Demonstrate data encryption capabilities."""
     print("\n🔐 Data Encryption Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     print("Encrypting location data...")
     for i in range(3):
@@ -117,12 +134,13 @@ def demo_encryption():
     
     print("\n✅ Data Encryption Demo Complete")
 
-def demo_protection_levels():
+def demo_protection_levels(anti_gps=None):
     """Demonstrate different protection levels."""
     print("\n🛡️ Protection Levels Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     protection_levels = ["low", "medium", "high", "maximum"]
     
@@ -134,7 +152,7 @@ def demo_protection_levels():
         print(f"  📋 Methods: {', '.join(methods)}")
         
         # Simulate threat
-        sample_signals = [{"frequency": "L1", "strength": 0.8, "quality": 0.9}]
+        sample_signals = [Signal("L1", strength=0.8, quality=0.9)]
         
         if level in ["high", "maximum"]:
             anti_gps.apply_protection(sample_signals)
@@ -145,20 +163,21 @@ def demo_protection_levels():
     
     print("\n✅ Protection Levels Demo Complete")
 
-def demo_threat_assessment():
+def demo_threat_assessment(anti_gps=None):
     """Demonstrate threat assessment capabilities."""
     print("\n🚨 Threat Assessment Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     # Test different threat scenarios
     threat_scenarios = [
         {"name": "No Threat", "signals": []},
-        {"name": "Low Threat", "signals": [{"strength": 0.3, "quality": 0.6}]},
-        {"name": "Medium Threat", "signals": [{"strength": 0.7, "quality": 0.8}]},
-        {"name": "High Threat", "signals": [{"strength": 0.9, "quality": 0.9}]},
-        {"name": "Critical Threat", "signals": [{"strength": 1.0, "quality": 0.95}]}
+        {"name": "Low Threat", "signals": [Signal("L1", strength=0.3, quality=0.6)]},
+        {"name": "Medium Threat", "signals": [Signal("L1", strength=0.7, quality=0.8)]},
+        {"name": "High Threat", "signals": [Signal("L1", strength=0.9, quality=0.9)]},
+        {"name": "Critical Threat", "signals": [Signal("L1", strength=1.0, quality=0.95)]}
     ]
     
     for scenario in threat_scenarios:
@@ -183,7 +202,7 @@ def interactive_demo():
     print("\n🎮 Interactive Anti GPS Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    anti_gps = _get_system()
     
     print("Choose a demo option:")
     print("1. 🔍 GPS Signal Detection")
@@ -200,22 +219,25 @@ def interactive_demo():
         try:
             choice = input("\nEnter your choice (1-9): ").strip()
             
+            # Each demo starts from default settings, as if on a fresh system
+            anti_gps.reset_settings()
+            
             if choice == "1":
-                demo_gps_detection()
+                demo_gps_detection(anti_gps)
             elif choice == "2":
-                demo_location_spoofing()
+                demo_location_spoofing(anti_gps)
             elif choice == "3":
-                demo_signal_jamming()
+                demo_signal_jamming(anti_gps)
             elif choice == "4":
-                demo_frequency_hopping()
+                demo_frequency_hopping(anti_gps)
             elif choice == "5":
-                demo_encryption()
+                demo_encryption(anti_gps)
             elif choice == "6":
-                demo_protection_levels()
+                demo_protection_levels(anti_gps)
             elif choice == "7":
-                demo_threat_assessment()
+                demo_threat_assessment(anti_gps)
             elif choice == "8":
-                full_system_demo()
+                full_system_demo(anti_gps)
             elif choice == "9":
                 print("👋 Thanks for trying the Anti GPS System!")
                 break
@@ -228,12 +250,13 @@ def interactive_demo():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-def full_system_demo():
+def full_system_demo(anti_gps=None):
     """Run a complete system demonstration."""
     print("\n🎯 Full Anti GPS System Demo")
     print("=" * 50)
     
-    anti_gps = AntiGPSSystem()
+    if anti_gps is None:
+        anti_gps = AntiGPSSystem()
     
     print("🚀 Starting comprehensive system demo...")
     
@@ -245,7 +268,9 @@ def full_system_demo():
     print("🔍 Detection Mode: ACTIVE")
     
     # Simulate continuous monitoring
-    for i in range(5):
+    import asyncio  # deferred like in anti_gps: only this demo needs the event loop
+    
+    async def scan_once(i):
         print(f"\n📡 Scan {i+1}/5...")
         
         # Detect signals
@@ -263,7 +288,13 @@ def full_system_demo():
         else:
             print("✅ No threats detected")
         
-        time.sleep(1)
+        await asyncio.sleep(1)
+    
+    async def run_scans():
+        # Scans run in order up to their pause, so the pauses overlap
+        await asyncio.gather(*(scan_once(i) for i in range(5)))
+    
+    asyncio.run(run_scans())
     
     # Show final status
     status = anti_gps.get_status()
@@ -275,6 +306,9 @@ def full_system_demo():
 
 def main():
     """Main demo function."""
+    # Show the system's own progress messages alongside the demo output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("🛡️ ANTI GPS SYSTEM DEMO")
     print("=" * 50)
     print("GPS Signal Detection and Privacy Protection")
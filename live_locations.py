@@ -7,19 +7,28 @@ Real-time GPS location tracking and display system.
 import time
 import random
 import threading
-from datetime import datetime
-import json
 import os
-from math import radians, cos, sin, sqrt, atan2
+import sys
+from collections import deque
+from itertools import islice
+from math import radians, cos, sin, sqrt, asin
+from log_utils import BackgroundLogWriter, IsoClock
 
 class LiveLocationTracker:
     def __init__(self):
         """Initialize the Live Location Tracker."""
         self.is_tracking = False
         self.current_location = None
-        self.location_history = []
+        self.location_history = deque(maxlen=100)  # last 100 locations
+        self.segment_distances = deque(maxlen=99)  # km between consecutive history points
+        self.total_distance = 0.0  # running sum of segment_distances
         self.tracking_interval = 1.0  # seconds
         self.log_file = "live_locations_log.txt"
+        self.log_writer = None  # created on first log_location call
+        self.stop_event = threading.Event()  # set by stop_tracking to wake tracking_loop early
+        self.clock = IsoClock()
+        self.rng = random.Random()  # private stream for simulated readings
+        self.location_draws = iter(())  # prefilled sample picks, refilled in batches
         
         # Sample locations for demonstration
         self.sample_locations = [
@@ -35,42 +44,64 @@ class LiveLocationTracker:
             {"name": "Mumbai", "lat": 19.0760, "lon": 72.8777, "country": "India"}
         ]
         
+        # Precompute radians so the haversine path never converts degrees
+        for sample in self.sample_locations:
+            sample["lat_rad"] = radians(sample["lat"])
+            sample["lon_rad"] = radians(sample["lon"])
+        
         print("📍 Live Location Tracker Initialized")
         print("=" * 50)
     
     def get_current_location(self):
         """Get current GPS location (simulated)."""
         # Simulate GPS location acquisition
-        location = random.choice(self.sample_locations)
+        location = next(self.location_draws, None)
+        if location is None:
+            # One choices() call picks the next batch of sample locations
+            self.location_draws = iter(self.rng.choices(self.sample_locations, k=1024))
+            location = next(self.location_draws)
+        
+        # Draw raw [0, 1) floats and scale inline rather than via uniform()
+        r = self.rng.random
         
         # Add some random variation to simulate movement
-        lat_variation = random.uniform(-0.001, 0.001)
-        lon_variation = random.uniform(-0.001, 0.001)
+        lat_variation = r() * 0.002 - 0.001
+        lon_variation = r() * 0.002 - 0.001
         
         current_location = {
             "name": location["name"],
             "lat": location["lat"] + lat_variation,
             "lon": location["lon"] + lon_variation,
+            "lat_rad": location["lat_rad"] + radians(lat_variation),
+            "lon_rad": location["lon_rad"] + radians(lon_variation),
             "country": location["country"],
-            "timestamp": datetime.now().isoformat(),
-            "accuracy": random.uniform(5, 20),  # meters
-            "speed": random.uniform(0, 50),  # km/h
-            "heading": random.uniform(0, 360),  # degrees
-            "altitude": random.uniform(0, 1000)  # meters
+            "timestamp": self.current_timestamp(),
+            "accuracy": 5 + r() * 15,  # meters
+            "speed": r() * 50,  # km/h
+            "heading": r() * 360,  # degrees
+            "altitude": r() * 1000  # meters
         }
         
         return current_location
     
+    def current_timestamp(self):
+        """Current ISO timestamp for a new location fix."""
+        return self.clock.now()
+    
     def calculate_distance(self, lat1, lon1, lat2, lon2):
         """Calculate distance between two GPS coordinates in kilometers."""
+        return self.calculate_distance_rad(radians(lat1), radians(lon1),
+                                           radians(lat2), radians(lon2))
+    
+    def calculate_distance_rad(self, lat1, lon1, lat2, lon2):
+        """Calculate distance in kilometers between coordinates given in radians."""
         R = 6371  # Earth's radius in kilometers
         
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        sin_dlat = sin((lat2 - lat1) * 0.5)
+        sin_dlon = sin((lon2 - lon1) * 0.5)
         
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
+        a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+        c = 2 * asin(min(1.0, sqrt(a)))  # same angle as atan2(sqrt(a), sqrt(1-a))
         distance = R * c
         
         return distance
@@ -93,6 +124,7 @@ class LiveLocationTracker:
         """Start live location tracking."""
         print("🚀 Starting live location tracking...")
         self.is_tracking = True
+        self.reset_stop()
         
         # Start tracking in a separate thread
         tracking_thread = threading.Thread(target=self.tracking_loop)
@@ -107,26 +139,52 @@ class LiveLocationTracker:
             try:
                 # Get current location
                 location = self.get_current_location()
-                self.current_location = location
-                self.location_history.append(location)
-                
-                # Keep only last 100 locations
-                if len(self.location_history) > 100:
-                    self.location_history = self.location_history[-100:]
+                self.record_location(location)
                 
                 # Log location
                 self.log_location(location)
                 
-                # Wait before next update
-                time.sleep(self.tracking_interval)
+                # Wait before next update, or until woken by stop_tracking
+                self.wait_for_tick(self.tracking_interval)
                 
             except Exception as e:
                 print(f"❌ Tracking error: {e}")
-                time.sleep(1)
+                self.wait_for_tick(1)
+    
+    def wait_for_tick(self, timeout):
+        """Block until the next tick is due or stop_tracking sets the stop event."""
+        self.stop_event.wait(timeout)
+    
+    def record_location(self, location):
+        """Make a location current and add it to the history."""
+        # Update the running distance with just the new segment
+        if self.location_history:
+            prev = self.location_history[-1]
+            segment = self.calculate_distance_rad(
+                prev["lat_rad"], prev["lon_rad"],
+                location["lat_rad"], location["lon_rad"]
+            )
+            
+            # The oldest segment falls out of the window along with its point
+            if len(self.segment_distances) == self.segment_distances.maxlen:
+                self.total_distance -= self.segment_distances[0]
+            self.segment_distances.append(segment)
+            self.total_distance += segment
+        
+        self.current_location = location
+        self.location_history.append(location)
+    
+    def reset_stop(self):
+        """Re-arm wait_for_tick before a new tracking loop starts.
+        
+        A stop issued while idle would otherwise cut every wait of the next loop short.
+        """
+        self.stop_event.clear()
     
     def stop_tracking(self):
         """Stop live location tracking."""
         self.is_tracking = False
+        self.stop_event.set()  # wake the tracking loop so it exits now
         print("🛑 Location tracking stopped")
     
     def log_location(self, location):
@@ -139,29 +197,25 @@ class LiveLocationTracker:
             "accuracy": location["accuracy"]
         }
         
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Hand the entry to the background writer instead of doing file I/O here
+        if self.log_writer is None:
+            self.log_writer = BackgroundLogWriter(self.log_file)
+        self.log_writer.write(log_entry)
+    
+    def close(self):
+        """Flush pending log entries and stop the writer thread."""
+        if self.log_writer is not None:
+            self.log_writer.close()
     
     def get_location_history(self, limit=10):
         """Get recent location history."""
-        return self.location_history[-limit:] if self.location_history else []
+        start = max(len(self.location_history) - limit, 0)
+        return list(islice(self.location_history, start, None))
     
     def get_distance_traveled(self):
         """Calculate total distance traveled."""
-        if len(self.location_history) < 2:
-            return 0
-        
-        total_distance = 0
-        for i in range(1, len(self.location_history)):
-            prev = self.location_history[i-1]
-            curr = self.location_history[i]
-            distance = self.calculate_distance(
-                prev["lat"], prev["lon"],
-                curr["lat"], curr["lon"]
-            )
-            total_distance += distance
-        
-        return total_distance
+        # Maintained incrementally by record_location
+        return self.total_distance
     
     def get_current_status(self):
         """Get current tracking status."""
@@ -174,6 +228,10 @@ class LiveLocationTracker:
         }
         return status
 
+# Terminal frame constants for display_live_location
+CLEAR_SCREEN = "\x1b[H\x1b[2J"  # ANSI: cursor home + erase display
+SEPARATOR = "=" * 50
+
 def display_live_location():
     """Display live location information."""
     tracker = LiveLocationTracker()
@@ -186,42 +244,61 @@ def display_live_location():
     # Start tracking
     tracker.start_tracking()
     
+    prev_lines = None  # last frame drawn, for redrawing only changed rows
+    
     try:
         while True:
             if tracker.current_location:
                 location = tracker.current_location
-                info = tracker.get_location_info(location)
                 
-                # Clear screen (works on most terminals)
-                os.system('cls' if os.name == 'nt' else 'clear')
-                
-                print("📍 LIVE LOCATION TRACKER")
-                print("=" * 50)
-                print(f"🌍 Location: {info['city']}, {info['country']}")
-                print(f"📍 Coordinates: {info['coordinates']}")
-                print(f"🎯 Accuracy: {info['accuracy']}")
-                print(f"🚗 Speed: {info['speed']}")
-                print(f"🧭 Heading: {info['heading']}")
-                print(f"⛰️  Altitude: {info['altitude']}")
-                print(f"⏰ Time: {info['timestamp']}")
-                print("=" * 50)
+                # Formatted straight into the frame rather than via get_location_info
+                lines = [
+                    "📍 LIVE LOCATION TRACKER",
+                    SEPARATOR,
+                    f"🌍 Location: {location['name']}, {location['country']}",
+                    f"📍 Coordinates: {location['lat']:.6f}, {location['lon']:.6f}",
+                    f"🎯 Accuracy: {location['accuracy']:.1f}m",
+                    f"🚗 Speed: {location['speed']:.1f} km/h",
+                    f"🧭 Heading: {location['heading']:.1f}°",
+                    f"⛰️  Altitude: {location['altitude']:.0f}m",
+                    f"⏰ Time: {location['timestamp']}",
+                    SEPARATOR
+                ]
                 
                 # Show recent history
                 history = tracker.get_location_history(5)
                 if history:
-                    print("📜 Recent Locations:")
+                    lines.append("📜 Recent Locations:")
                     for i, loc in enumerate(history[-5:], 1):
-                        print(f"  {i}. {loc['name']} ({loc['lat']:.4f}, {loc['lon']:.4f})")
+                        lines.append(f"  {i}. {loc['name']} ({loc['lat']:.4f}, {loc['lon']:.4f})")
                 
                 # Show status
                 status = tracker.get_current_status()
-                print(f"\n📊 Status: Tracking Active | Total: {status['total_locations']} | Distance: {status['distance_traveled']}")
+                lines.append("")
+                lines.append(f"📊 Status: Tracking Active | Total: {status['total_locations']} | Distance: {status['distance_traveled']}")
+                
+                # Draw the whole frame in a single write when the layout is new
+                if os.name == 'nt':
+                    os.system('cls')
+                    sys.stdout.write("\n".join(lines) + "\n")
+                elif prev_lines is None or len(lines) != len(prev_lines):
+                    sys.stdout.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+                else:
+                    # Same layout: rewrite only the rows whose text changed
+                    sys.stdout.write("".join(
+                        f"\x1b[{row};1H\x1b[2K{line}"
+                        for row, (line, prev) in enumerate(zip(lines, prev_lines), 1)
+                        if line != prev
+                    ) + f"\x1b[{len(lines) + 1};1H")
+                sys.stdout.flush()
+                prev_lines = lines
                 
             time.sleep(2)
             
     except KeyboardInterrupt:
         print("\n🛑 Stopping live location tracking...")
         tracker.stop_tracking()
+        tracker.close()
         
         # Show final summary
         print("\n📊 TRACKING SUMMARY")
@@ -7,25 +7,59 @@ Enhanced GPS location tracking with weather, traffic, routes, and shareable link
 import time
 import random
 import threading
-from datetime import datetime, timedelta
-import json
+from datetime import timedelta
 import os
-from math import radians, cos, sin, sqrt, atan2
+from collections import deque
+from functools import partial
+from itertools import islice
+from math import radians, cos, sin, sqrt, asin
 import tkinter as tk
 from tkinter import ttk, messagebox
 import webbrowser
 import urllib.parse
 import base64
 from io import BytesIO
+from log_utils import BackgroundLogWriter, IsoClock
+from tk_helpers import Toast
+
+def _sleep_until_next_tick(deadline, interval):
+    """Sleep until one interval past deadline and return the new deadline.
+    
+    Ticks are paced on time.monotonic(), so the work done in each tick does not
+    stretch the period. After an overrun the schedule restarts from now.
+    """
+    deadline += interval
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    else:
+        deadline = time.monotonic()
+    return deadline
 
 class AdvancedLocationTracker:
+    # urllib.parse.quote("https://maps.google.com/?q="), computed once
+    _MAPS_PREFIX_QUOTED = urllib.parse.quote("https://maps.google.com/?q=")
+    
     def __init__(self):
         """Initialize the Advanced Location Tracker."""
         self.is_tracking = False
         self.current_location = None
-        self.location_history = []
+        self.location_history = deque(maxlen=100)  # last 100 locations
+        # Columnar copies of the history's coordinates for distance scans
+        self.lat_column = deque(maxlen=100)
+        self.lon_column = deque(maxlen=100)
+        self.cos_lat_column = deque(maxlen=100)
+        # Guards the history and columns: the tracking thread writes, the GUI reads
+        self.history_lock = threading.Lock()
         self.tracking_interval = 1.0
         self.log_file = "advanced_locations_log.txt"
+        self.log_writer = None  # created on first log_location call
+        self.subscribers = []  # callables invoked with each newly recorded location
+        self.error_subscribers = []  # callables invoked with each tracking error
+        self.rng = random.Random()  # per-tracker stream, not the shared module state
+        self.clock = IsoClock()
+        self.share_links_key = None  # inputs of the last generate_shareable_links call
+        self.share_links = None
         self.route_mode = False
         self.weather_enabled = True
         self.traffic_enabled = True
@@ -50,43 +84,60 @@ class AdvancedLocationTracker:
             {"name": "Istanbul", "lat": 41.0082, "lon": 28.9784, "country": "Turkey", "timezone": "TRT", "population": "15.5M"}
         ]
         
+        # Distances between sample-city pairs, keyed by (start name, end name)
+        self.city_distance_cache = {}
+        
+        # Precompute trig for the fixed cities so distance math never redoes it
+        for sample in self.sample_locations:
+            sample["lat_rad"] = radians(sample["lat"])
+            sample["lon_rad"] = radians(sample["lon"])
+            sample["cos_lat"] = cos(sample["lat_rad"])
+        
         # Weather conditions
         self.weather_conditions = ["Sunny", "Cloudy", "Rainy", "Snowy", "Foggy", "Stormy", "Clear", "Partly Cloudy"]
         
         # Traffic conditions
         self.traffic_conditions = ["Light", "Moderate", "Heavy", "Congested", "Clear", "Slow", "Standstill"]
         
+        # Network types
+        self.network_types = ("4G", "5G", "WiFi", "3G")
+        
         print("📍 Advanced Location Tracker Initialized")
         print("=" * 60)
     
     def get_current_location(self):
         """Get current GPS location with enhanced data."""
-        location = random.choice(self.sample_locations)
+        location = self.rng.choice(self.sample_locations)
+        
+        # Draw raw [0, 1) floats and scale inline rather than via uniform()
+        r = self.rng.random
         
         # Add variation for realistic movement
-        lat_variation = random.uniform(-0.001, 0.001)
-        lon_variation = random.uniform(-0.001, 0.001)
+        lat_variation = r() * 0.002 - 0.001
+        lon_variation = r() * 0.002 - 0.001
         
         # Enhanced location data
         current_location = {
             "name": location["name"],
             "lat": location["lat"] + lat_variation,
             "lon": location["lon"] + lon_variation,
+            "lat_rad": location["lat_rad"] + radians(lat_variation),
+            "lon_rad": location["lon_rad"] + radians(lon_variation),
             "country": location["country"],
             "timezone": location["timezone"],
             "population": location["population"],
-            "timestamp": datetime.now().isoformat(),
-            "accuracy": random.uniform(3, 15),
-            "speed": random.uniform(0, 80),
-            "heading": random.uniform(0, 360),
-            "altitude": random.uniform(0, 2000),
-            "weather": random.choice(self.weather_conditions),
-            "temperature": random.uniform(-10, 40),
-            "humidity": random.uniform(30, 90),
-            "traffic": random.choice(self.traffic_conditions),
-            "battery_level": random.uniform(20, 100),
-            "signal_strength": random.uniform(1, 5),
-            "network_type": random.choice(["4G", "5G", "WiFi", "3G"]),
+            "timestamp": self.current_timestamp(),
+            "accuracy": 3 + r() * 12,
+            "speed": r() * 80,
+            "heading": r() * 360,
+            "altitude": r() * 2000,
+            "weather": self.rng.choice(self.weather_conditions),
+            "temperature": -10 + r() * 50,
+            "humidity": 30 + r() * 60,
+            "traffic": self.rng.choice(self.traffic_conditions),
+            "battery_level": 20 + r() * 80,
+            "signal_strength": 1 + r() * 4,
+            "network_type": self.rng.choice(self.network_types),
             "estimated_arrival": None,
             "route_distance": 0,
             "route_duration": 0
@@ -94,26 +145,50 @@ class AdvancedLocationTracker:
         
         return current_location
     
+    def current_timestamp(self):
+        """Current ISO timestamp for a new location fix."""
+        return self.clock.now()
+    
     def calculate_distance(self, lat1, lon1, lat2, lon2):
-        """Calculate distance between GPS coordinates."""
+        """Calculate distance in kilometers between GPS coordinates given in degrees.
+        
+        Takes plain floats and stays on math.* on purpose: scalar NumPy calls
+        are several times slower than math for single values.
+        """
         R = 6371
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
+        lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+        sin_dlat = sin((lat2 - lat1) * 0.5)
+        sin_dlon = sin((lon2 - lon1) * 0.5)
+        a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+        c = 2 * asin(min(1.0, sqrt(a)))  # same angle as atan2(sqrt(a), sqrt(1-a))
         return R * c
     
+    def calculate_distance_precomp(self, a, b):
+        """Distance in kilometers between two sample cities using their cached trig."""
+        key = (a["name"], b["name"])
+        distance = self.city_distance_cache.get(key)
+        if distance is not None:
+            return distance
+        
+        sin_dlat = sin((b["lat_rad"] - a["lat_rad"]) * 0.5)
+        sin_dlon = sin((b["lon_rad"] - a["lon_rad"]) * 0.5)
+        h = sin_dlat * sin_dlat + a["cos_lat"] * b["cos_lat"] * sin_dlon * sin_dlon
+        distance = 2 * 6371 * asin(min(1.0, sqrt(h)))
+        
+        # Only 15 cities, so every ordered pair fits in the cache
+        self.city_distance_cache[key] = distance
+        return distance
+    
     def get_weather_info(self, location):
         """Get weather information for location."""
         weather_info = {
             "condition": location["weather"],
             "temperature": f"{location['temperature']:.1f}°C",
             "humidity": f"{location['humidity']:.0f}%",
-            "feels_like": f"{location['temperature'] + random.uniform(-5, 5):.1f}°C",
-            "wind_speed": f"{random.uniform(0, 30):.1f} km/h",
-            "visibility": f"{random.uniform(5, 20):.1f} km",
-            "uv_index": random.randint(0, 10)
+            "feels_like": f"{location['temperature'] + self.rng.uniform(-5, 5):.1f}°C",
+            "wind_speed": f"{self.rng.uniform(0, 30):.1f} km/h",
+            "visibility": f"{self.rng.uniform(5, 20):.1f} km",
+            "uv_index": self.rng.randint(0, 10)
         }
         return weather_info
     
@@ -121,23 +196,27 @@ class AdvancedLocationTracker:
         """Get traffic information for location."""
         traffic_info = {
             "condition": location["traffic"],
-            "delay_minutes": random.randint(0, 45),
-            "average_speed": f"{random.uniform(10, 80):.0f} km/h",
-            "congestion_level": random.randint(1, 10),
-            "incidents": random.randint(0, 3),
-            "road_conditions": random.choice(["Good", "Fair", "Poor", "Excellent"])
+            "delay_minutes": self.rng.randint(0, 45),
+            "average_speed": f"{self.rng.uniform(10, 80):.0f} km/h",
+            "congestion_level": self.rng.randint(1, 10),
+            "incidents": self.rng.randint(0, 3),
+            "road_conditions": self.rng.choice(["Good", "Fair", "Poor", "Excellent"])
         }
         return traffic_info
     
     def get_route_info(self, start_location, end_location):
         """Calculate route information."""
-        distance = self.calculate_distance(
-            start_location["lat"], start_location["lon"],
-            end_location["lat"], end_location["lon"]
-        )
+        if "cos_lat" in start_location and "cos_lat" in end_location:
+            # Both endpoints are sample cities with precomputed trig
+            distance = self.calculate_distance_precomp(start_location, end_location)
+        else:
+            distance = self.calculate_distance(
+                start_location["lat"], start_location["lon"],
+                end_location["lat"], end_location["lon"]
+            )
         
         # Estimate travel time based on traffic and speed
-        avg_speed = random.uniform(30, 80)
+        avg_speed = self.rng.uniform(30, 80)
         duration_hours = distance / avg_speed
         duration_minutes = duration_hours * 60
         
@@ -147,8 +226,8 @@ class AdvancedLocationTracker:
             "avg_speed": f"{avg_speed:.0f} km/h",
             "fuel_consumption": f"{distance * 0.08:.1f} L",
             "co2_emission": f"{distance * 0.2:.1f} kg",
-            "tolls": random.randint(0, 3),
-            "rest_stops": random.randint(0, 2)
+            "tolls": self.rng.randint(0, 3),
+            "rest_stops": self.rng.randint(0, 2)
         }
         return route_info
     
@@ -185,9 +264,20 @@ class AdvancedLocationTracker:
         city_name = location["name"]
         country = location["country"]
         
+        # Reopening the share dialog for an unchanged fix reuses the last links
+        key = (lat, lon, city_name, country, location["weather"],
+               location["temperature"], location["traffic"], location["speed"])
+        if key == self.share_links_key:
+            return dict(self.share_links)
+        
         # Create location description
         location_desc = f"{city_name}, {country}"
         
+        # Fragments shared by several links, built once per call
+        maps_url = f"https://maps.google.com/?q={lat},{lon}"
+        maps_url_quoted = f"{self._MAPS_PREFIX_QUOTED}{lat}%2C{lon}"  # == quote(maps_url)
+        im_at = f"📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})"
+        
         # Generate different types of shareable links
         links = {
             "google_maps": f"https://www.google.com/maps?q={lat},{lon}",
@@ -195,19 +285,27 @@ class AdvancedLocationTracker:
             "waze": f"https://waze.com/ul?ll={lat},{lon}&navigate=yes",
             "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
             "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
-            "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "telegram": f"https://t.me/share/url?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}&text=📍 I'm at {location_desc}",
-            "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})&url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "facebook": f"https://www.facebook.com/sharer/sharer.php?u={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0AView on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "sms": f"sms:?body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "qr_code_data": f"https://maps.google.com/?q={lat},{lon}",
+            "whatsapp": f"https://wa.me/?text={im_at}",
+            "telegram": f"https://t.me/share/url?url={maps_url_quoted}&text=📍 I'm at {location_desc}",
+            "twitter": f"https://twitter.com/intent/tweet?text={im_at}&url={maps_url_quoted}",
+            "facebook": f"https://www.facebook.com/sharer/sharer.php?u={maps_url_quoted}",
+            "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={maps_url_quoted}",
+            "email": f"mailto:?subject=📍 My Location&body={im_at}%0A%0AView on Google Maps: {maps_url}",
+            "sms": f"sms:?body={im_at}",
+            "qr_code_data": maps_url,
             "deep_link": f"geo:{lat},{lon}?q={urllib.parse.quote(location_desc)}",
-            "custom_share": f"📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0A🌤️ Weather: {location['weather']} | 🌡️ {location['temperature']:.1f}°C%0A🚦 Traffic: {location['traffic']} | 🚗 {location['speed']:.1f} km/h%0A%0A🗺️ View on Google Maps: https://maps.google.com/?q={lat},{lon}"
+            "custom_share": f"{im_at}%0A%0A🌤️ Weather: {location['weather']} | 🌡️ {location['temperature']:.1f}°C%0A🚦 Traffic: {location['traffic']} | 🚗 {location['speed']:.1f} km/h%0A%0A🗺️ View on Google Maps: {maps_url}"
         }
         
-        return links
+        self.share_links_key = key
+        self.share_links = links
+        return dict(links)
+    
+    def generate_shareable_links_batch(self, locations):
+        """Generate shareable links for several locations, e.g. a history export."""
+        # Per-call fragments are already shared inside generate_shareable_links
+        generate = self.generate_shareable_links
+        return [generate(location) for location in locations]
     
     def start_tracking(self):
         """Start advanced location tracking."""
@@ -222,21 +320,37 @@ class AdvancedLocationTracker:
     
     def tracking_loop(self):
         """Enhanced tracking loop with additional features."""
+        next_tick = time.monotonic()
         while self.is_tracking:
             try:
                 location = self.get_current_location()
-                self.current_location = location
-                self.location_history.append(location)
-                
-                if len(self.location_history) > 100:
-                    self.location_history = self.location_history[-100:]
+                self.record_location(location)
                 
                 self.log_location(location)
-                time.sleep(self.tracking_interval)
+                
+                for callback in self.subscribers:
+                    callback(location)
+                
+                next_tick = _sleep_until_next_tick(next_tick, self.tracking_interval)
                 
             except Exception as e:
-                print(f"❌ Tracking error: {e}")
+                if self.error_subscribers:
+                    for callback in self.error_subscribers:
+                        callback(e)
+                else:
+                    print(f"❌ Tracking error: {e}")
                 time.sleep(1)
+                next_tick = time.monotonic()
+    
+    def record_location(self, location):
+        """Make a location current and add it to the history and coordinate columns."""
+        cos_lat = cos(location["lat_rad"])
+        with self.history_lock:
+            self.current_location = location
+            self.location_history.append(location)
+            self.lat_column.append(location["lat_rad"])
+            self.lon_column.append(location["lon_rad"])
+            self.cos_lat_column.append(cos_lat)
     
     def stop_tracking(self):
         """Stop location tracking."""
@@ -256,29 +370,56 @@ class AdvancedLocationTracker:
             "battery": location["battery_level"]
         }
         
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Hand the entry to the background writer instead of doing file I/O here
+        if self.log_writer is None:
+            self.log_writer = BackgroundLogWriter(self.log_file)
+        self.log_writer.write(log_entry)
+    
+    def close(self):
+        """Flush pending log entries and stop the writer thread."""
+        if self.log_writer is not None:
+            self.log_writer.close()
     
     def get_location_history(self, limit=10):
         """Get recent location history."""
-        return self.location_history[-limit:] if self.location_history else []
+        with self.history_lock:
+            # Walk in from the newest end so only `limit` entries are touched
+            recent = list(islice(reversed(self.location_history), limit))
+        recent.reverse()
+        return recent
     
     def get_distance_traveled(self):
         """Calculate total distance traveled."""
-        if len(self.location_history) < 2:
-            return 0
+        # Snapshot under the lock so the tracking thread can't mutate mid-scan
+        with self.history_lock:
+            lats = tuple(self.lat_column)
+            lons = tuple(self.lon_column)
+            cos_lats = tuple(self.cos_lat_column)
         
-        total_distance = 0
-        for i in range(1, len(self.location_history)):
-            prev = self.location_history[i-1]
-            curr = self.location_history[i]
-            distance = self.calculate_distance(
-                prev["lat"], prev["lon"],
-                curr["lat"], curr["lon"]
-            )
-            total_distance += distance
+        if len(lats) < 2:
+            return 0
         
-        return total_distance
+        # Walk the coordinate columns pairwise; cos(lat) was computed once on record
+        total = 0.0
+        for lat1, lat2, lon1, lon2, cos1, cos2 in zip(
+            lats, islice(lats, 1, None),
+            lons, islice(lons, 1, None),
+            cos_lats, islice(cos_lats, 1, None)
+        ):
+            dlat = lat2 - lat1
+            dlon = lon2 - lon1
+            if -1e-3 < dlat < 1e-3 and -1e-3 < dlon < 1e-3:
+                # Jitter around the same city (< ~6 km): the equirectangular
+                # approximation matches haversine here without any trig
+                x = dlon * (cos1 + cos2) * 0.5
+                total += 0.5 * sqrt(dlat * dlat + x * x)
+                continue
+            sin_dlat = sin(dlat * 0.5)
+            sin_dlon = sin(dlon * 0.5)
+            a = sin_dlat * sin_dlat + cos1 * cos2 * sin_dlon * sin_dlon
+            total += asin(min(1.0, sqrt(a)))
+        
+        return 2 * 6371 * total
     
     def get_current_status(self):
         """Get comprehensive tracking status."""
@@ -296,6 +437,29 @@ class AdvancedLocationTracker:
         return status
 
 class AdvancedLocationGUI:
+    # Share-link notebook tabs: (tab title, ((name, links key, icon), ...))
+    _LINK_TABS = (
+        ("🗺️ Maps", (
+            ("Google Maps", "google_maps", "🌐"),
+            ("Apple Maps", "apple_maps", "🍎"),
+            ("Waze", "waze", "🚗"),
+            ("Bing Maps", "bing_maps", "🔍"),
+            ("OpenStreetMap", "openstreetmap", "🗺️")
+        )),
+        ("📱 Social", (
+            ("WhatsApp", "whatsapp", "💬"),
+            ("Telegram", "telegram", "📱"),
+            ("Twitter", "twitter", "🐦"),
+            ("Facebook", "facebook", "📘"),
+            ("LinkedIn", "linkedin", "💼")
+        )),
+        ("📧 Communication", (
+            ("Email", "email", "📧"),
+            ("SMS", "sms", "💬"),
+            ("Deep Link", "deep_link", "🔗")
+        ))
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("📍 Advanced Location Tracker")
@@ -303,8 +467,19 @@ class AdvancedLocationGUI:
         self.root.configure(bg='#1a1a1a')
         
         self.tracker = AdvancedLocationTracker()
+        self.tracker.tracking_interval = 2.0  # GUI refresh pace
+        self.tracker.subscribers.append(self.on_new_location)
+        self.tracker.error_subscribers.append(
+            lambda e: self.root.after(0, self.log_message, f"Error: {str(e)}"))
         self.tracking_thread = None
         self.is_tracking = False
+        self.last_status_display = None  # status text currently shown
+        self.share_window = None  # built on first show_share_links, then reused
+        self.share_links = None  # links the share window's buttons act on
+        self.share_trees = []  # one Treeview per link tab, filled by build_link_tab
+        
+        # Clear-and-append as one Tcl proc, so a copy is a single call into Tcl
+        self.root.tk.eval('proc ::set_clipboard {text} {clipboard clear; clipboard append -- $text}')
         
         self.setup_gui()
     
@@ -460,6 +635,11 @@ class AdvancedLocationGUI:
         self.status_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         status_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # Transient, non-modal confirmation line under the status area
+        toast_label = ttk.Label(main_frame, text="", foreground="#00ff00")
+        toast_label.grid(row=6, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
+        self.toast = Toast(toast_label)
+        
         self.update_location_display()
     
     def start_tracking(self):
@@ -475,10 +655,8 @@ class AdvancedLocationGUI:
             self.tracker.route_mode = self.route_var.get()
             self.tracker.social_sharing = self.social_var.get()
             
-            # Start tracking thread
-            self.tracking_thread = threading.Thread(target=self.tracking_loop)
-            self.tracking_thread.daemon = True
-            self.tracking_thread.start()
+            # The tracker's own loop is the only producer; see on_new_location
+            self.tracking_thread = self.tracker.start_tracking()
             
             self.log_message("🚀 Advanced location tracking started")
             self.update_location_display()
@@ -494,57 +672,45 @@ class AdvancedLocationGUI:
             self.log_message("🛑 Advanced location tracking stopped")
             self.update_location_display()
     
-    def tracking_loop(self):
-        """Main tracking loop."""
-        while self.is_tracking:
-            try:
-                location = self.tracker.get_current_location()
-                self.tracker.current_location = location
-                self.tracker.location_history.append(location)
-                
-                if len(self.tracker.location_history) > 100:
-                    self.tracker.location_history = self.tracker.location_history[-100:]
-                
-                self.tracker.log_location(location)
-                
-                # Update GUI
-                self.root.after(0, self.update_location_display)
-                
-                time.sleep(2)
-                
-            except Exception as e:
-                self.root.after(0, self.log_message, f"Error: {str(e)}")
-                time.sleep(1)
+    def on_new_location(self, location):
+        """Tracker callback (tracking thread): schedule a display refresh on the Tk loop."""
+        self.root.after(0, self.update_location_display)
     
     def update_location_display(self):
         """Update all location displays."""
         if self.tracker.current_location:
             location = self.tracker.current_location
-            details = self.tracker.get_location_details(location)
             
-            # Update basic location info
-            for key, label in self.location_labels.items():
-                if key in details["basic_info"]:
-                    label.config(text=details["basic_info"][key])
-                elif key in details["gps_info"]:
-                    label.config(text=details["gps_info"][key])
+            # Format straight into the labels instead of building get_location_details
+            labels = self.location_labels
+            labels["city"].config(text=location["name"])
+            labels["country"].config(text=location["country"])
+            labels["coordinates"].config(text=f"{location['lat']:.6f}, {location['lon']:.6f}")
+            labels["timezone"].config(text=location["timezone"])
+            labels["population"].config(text=location["population"])
+            labels["accuracy"].config(text=f"{location['accuracy']:.1f}m")
+            labels["speed"].config(text=f"{location['speed']:.1f} km/h")
+            labels["heading"].config(text=f"{location['heading']:.1f}°")
+            labels["altitude"].config(text=f"{location['altitude']:.0f}m")
             
-            # Update weather info
+            # Update weather info; skipped entirely while the feature is off
             if self.tracker.weather_enabled:
+                weather = self.tracker.get_weather_info(location)
                 for key, label in self.weather_labels.items():
-                    if key in details["weather"]:
-                        label.config(text=details["weather"][key])
+                    label.config(text=weather[key])
             
-            # Update traffic info
+            # Update traffic info; skipped entirely while the feature is off
             if self.tracker.traffic_enabled:
+                traffic = self.tracker.get_traffic_info(location)
                 for key, label in self.traffic_labels.items():
-                    if key in details["traffic"]:
-                        label.config(text=details["traffic"][key])
+                    label.config(text=traffic[key])
             
             # Update device info
-            for key, label in self.device_labels.items():
-                if key in details["device_info"]:
-                    label.config(text=details["device_info"][key])
+            labels = self.device_labels
+            labels["battery"].config(text=f"{location['battery_level']:.0f}%")
+            labels["signal"].config(text=f"{location['signal_strength']:.0f}/5")
+            labels["network"].config(text=location["network_type"])
+            labels["timestamp"].config(text=location["timestamp"])
         
         # Update status
         status = self.tracker.get_current_status()
@@ -559,6 +725,11 @@ class AdvancedLocationGUI:
         status_display += f"Route Mode: {'ON' if status['route_mode'] else 'OFF'}\n"
         status_display += f"Social Sharing: {'ON' if status['social_sharing'] else 'OFF'}"
         
+        # Skip the Text widget rewrite (and its relayout) when nothing changed
+        if status_display == self.last_status_display:
+            return
+        self.last_status_display = status_display
+        
         self.status_text.delete(1.0, tk.END)
         self.status_text.insert(tk.END, status_display)
     
@@ -641,13 +812,29 @@ class AdvancedLocationGUI:
             return
         
         location = self.tracker.current_location
-        links = self.tracker.generate_shareable_links(location)
+        self.share_links = self.tracker.generate_shareable_links(location)
         
+        # The window is built once; later opens only refresh its contents
+        if self.share_window is None:
+            self.build_share_window()
+        self.refresh_share_window(location)
+        
+        self.share_window.deiconify()
+        self.share_window.lift()
+        
+        self.log_message("🔗 Shareable links window opened")
+    
+    def build_share_window(self):
+        """Create the share links window; buttons read self.share_links when clicked."""
         # Create share links window
         share_window = tk.Toplevel(self.root)
         share_window.title("🔗 Shareable Location Links")
         share_window.geometry("800x600")
         
+        # Closing only hides the window so it can be reused
+        share_window.protocol("WM_DELETE_WINDOW", share_window.withdraw)
+        self.share_window = share_window
+        
         # Main frame
         main_frame = ttk.Frame(share_window, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -661,95 +848,39 @@ class AdvancedLocationGUI:
         location_info = ttk.LabelFrame(main_frame, text="📍 Current Location", padding="10")
         location_info.pack(fill=tk.X, pady=(0, 20))
         
-        ttk.Label(location_info, text=f"🌍 {location['name']}, {location['country']}", 
-                 font=("Arial", 12, "bold")).pack()
-        ttk.Label(location_info, text=f"📍 {location['lat']:.6f}, {location['lon']:.6f}").pack()
-        ttk.Label(location_info, text=f"🌤️ {location['weather']} | 🌡️ {location['temperature']:.1f}°C").pack()
+        self.share_place_label = ttk.Label(location_info, font=("Arial", 12, "bold"))
+        self.share_place_label.pack()
+        self.share_coords_label = ttk.Label(location_info)
+        self.share_coords_label.pack()
+        self.share_weather_label = ttk.Label(location_info)
+        self.share_weather_label.pack()
         
         # Create notebook for different categories
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Maps tab
-        maps_frame = ttk.Frame(notebook)
-        notebook.add(maps_frame, text="🗺️ Maps")
-        
-        maps_links = [
-            ("Google Maps", links["google_maps"], "🌐"),
-            ("Apple Maps", links["apple_maps"], "🍎"),
-            ("Waze", links["waze"], "🚗"),
-            ("Bing Maps", links["bing_maps"], "🔍"),
-            ("OpenStreetMap", links["openstreetmap"], "🗺️")
-        ]
-        
-        for name, url, icon in maps_links:
-            frame = ttk.Frame(maps_frame)
-            frame.pack(fill=tk.X, pady=2)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: webbrowser.open(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_to_clipboard(u)).pack(side=tk.RIGHT, padx=(0, 5))
-        
-        # Social Media tab
-        social_frame = ttk.Frame(notebook)
-        notebook.add(social_frame, text="📱 Social")
-        
-        social_links = [
-            ("WhatsApp", links["whatsapp"], "💬"),
-            ("Telegram", links["telegram"], "📱"),
-            ("Twitter", links["twitter"], "🐦"),
-            ("Facebook", links["facebook"], "📘"),
-            ("LinkedIn", links["linkedin"], "💼")
-        ]
-        
-        for name, url, icon in social_links:
-            frame = ttk.Frame(social_frame)
-            frame.pack(fill=tk.X, pady=2)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: webbrowser.open(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_to_clipboard(u)).pack(side=tk.RIGHT, padx=(0, 5))
-        
-        # Communication tab
-        comm_frame = ttk.Frame(notebook)
-        notebook.add(comm_frame, text="📧 Communication")
-        
-        comm_links = [
-            ("Email", links["email"], "📧"),
-            ("SMS", links["sms"], "💬"),
-            ("Deep Link", links["deep_link"], "🔗")
-        ]
-        
-        for name, url, icon in comm_links:
-            frame = ttk.Frame(comm_frame)
-            frame.pack(fill=tk.X, pady=2)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: webbrowser.open(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_to_clipboard(u)).pack(side=tk.RIGHT, padx=(0, 5))
+        # Maps, Social and Communication tabs
+        for title, entries in self._LINK_TABS:
+            self.build_link_tab(notebook, title, entries)
         
         # Custom Share tab
         custom_frame = ttk.Frame(notebook)
         notebook.add(custom_frame, text="📤 Custom")
         
         # Custom share text
-        custom_text = ttk.Text(custom_frame, height=8, width=70)
-        custom_text.pack(pady=10)
-        custom_text.insert(tk.END, links["custom_share"])
+        self.share_custom_text = tk.Text(custom_frame, height=8, width=70)
+        self.share_custom_text.pack(pady=10)
         
         # Buttons for custom share
         custom_buttons = ttk.Frame(custom_frame)
         custom_buttons.pack(pady=10)
         
         ttk.Button(custom_buttons, text="📋 Copy Text", 
-                  command=lambda: self.copy_to_clipboard(custom_text.get(1.0, tk.END).strip())).pack(side=tk.LEFT, padx=(0, 10))
+                  command=self.copy_custom_share).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(custom_buttons, text="🔗 Copy Google Maps Link", 
-                  command=lambda: self.copy_to_clipboard(links["google_maps"])).pack(side=tk.LEFT, padx=(0, 10))
+                  command=partial(self.copy_share_link, "google_maps")).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(custom_buttons, text="📱 Copy QR Code Data", 
-                  command=lambda: self.copy_to_clipboard(links["qr_code_data"])).pack(side=tk.LEFT)
+                  command=partial(self.copy_share_link, "qr_code_data")).pack(side=tk.LEFT)
         
         # Quick actions frame
         quick_frame = ttk.LabelFrame(main_frame, text="⚡ Quick Actions", padding="10")
@@ -759,30 +890,102 @@ class AdvancedLocationGUI:
         quick_buttons.pack()
         
         ttk.Button(quick_buttons, text="🗺️ Open Google Maps", 
-                  command=lambda: webbrowser.open(links["google_maps"])).pack(side=tk.LEFT, padx=(0, 10))
+                  command=partial(self.open_share_link, "google_maps")).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(quick_buttons, text="💬 Share on WhatsApp", 
-                  command=lambda: webbrowser.open(links["whatsapp"])).pack(side=tk.LEFT, padx=(0, 10))
+                  command=partial(self.open_share_link, "whatsapp")).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(quick_buttons, text="📱 Share on Telegram", 
-                  command=lambda: webbrowser.open(links["telegram"])).pack(side=tk.LEFT, padx=(0, 10))
+                  command=partial(self.open_share_link, "telegram")).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(quick_buttons, text="📧 Send Email", 
-                  command=lambda: webbrowser.open(links["email"])).pack(side=tk.LEFT)
-        
-        self.log_message("🔗 Shareable links window opened")
+                  command=partial(self.open_share_link, "email")).pack(side=tk.LEFT)
+    
+    def refresh_share_window(self, location):
+        """Show the given location and its links in the share window."""
+        self.share_place_label.config(text=f"🌍 {location['name']}, {location['country']}")
+        self.share_coords_label.config(text=f"📍 {location['lat']:.6f}, {location['lon']:.6f}")
+        self.share_weather_label.config(text=f"🌤️ {location['weather']} | 🌡️ {location['temperature']:.1f}°C")
+        
+        for tree in self.share_trees:
+            for key in tree.get_children():
+                tree.set(key, "url", self.share_links[key])
+        
+        self.share_custom_text.delete(1.0, tk.END)
+        self.share_custom_text.insert(tk.END, self.share_links["custom_share"])
+        self.share_custom_text.edit_modified(False)  # set again by Tk if the user edits the text
+    
+    def build_link_tab(self, notebook, title, entries):
+        """Add a notebook tab listing each (name, links key, icon) entry in one Treeview."""
+        tab_frame = ttk.Frame(notebook)
+        notebook.add(tab_frame, text=title)
+        
+        # One widget for the whole tab; rows use the links key as their iid
+        tree = ttk.Treeview(tab_frame, columns=("url",), show="tree headings", height=len(entries))
+        tree.heading("#0", text="Service")
+        tree.heading("url", text="Link")
+        tree.column("#0", width=200, stretch=False)
+        for name, key, icon in entries:
+            tree.insert("", "end", iid=key, text=f"{icon} {name}")
+        tree.pack(fill=tk.BOTH, expand=True)
+        
+        open_row = partial(self.on_tree_activate, tree, self.open_share_link)
+        copy_row = partial(self.on_tree_activate, tree, self.copy_share_link)
+        tree.bind("<Double-1>", open_row)
+        tree.bind("<Control-c>", copy_row)
+        
+        # Right-click menu acting on the row under the pointer
+        menu = tk.Menu(tree, tearoff=0)
+        menu.add_command(label="🔗 Open", command=open_row)
+        menu.add_command(label="📋 Copy", command=copy_row)
+        tree.bind("<Button-3>", partial(self.show_tree_menu, tree, menu))
+        ttk.Label(tab_frame, text="Double-click to open, Ctrl+C or right-click to copy").pack(pady=(5, 0))
+        
+        self.share_trees.append(tree)
+    
+    def on_tree_activate(self, tree, action, event=None):
+        """Run action on the links key of the Treeview's focused row, if there is one."""
+        key = tree.focus()
+        if key:
+            action(key)
+    
+    def show_tree_menu(self, tree, menu, event):
+        """Focus the row under the pointer and pop up the link menu for it."""
+        row = tree.identify_row(event.y)
+        if row:
+            tree.focus(row)
+            tree.selection_set(row)
+            menu.tk_popup(event.x_root, event.y_root)
+    
+    def open_share_link(self, key):
+        """Open one of the current share links in the browser."""
+        webbrowser.open(self.share_links[key])
+    
+    def copy_share_link(self, key):
+        """Copy one of the current share links."""
+        self.copy_to_clipboard(self.share_links[key])
+    
+    def copy_custom_share(self):
+        """Copy the custom share text, reading the widget back only if it was edited."""
+        if self.share_custom_text.edit_modified():
+            self.copy_to_clipboard(self.share_custom_text.get(1.0, tk.END).strip())
+        else:
+            self.copy_to_clipboard(self.share_links["custom_share"])
+    
+    def set_clipboard(self, text):
+        """Replace the clipboard contents with text."""
+        # Passed as an argument, so no Tcl quoting of text is needed
+        self.root.tk.call('::set_clipboard', text)
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
-        self.root.clipboard_clear()
-        self.root.clipboard_append(text)
+        self.set_clipboard(text)
         self.log_message("📋 Link copied to clipboard")
-        messagebox.showinfo("Copy", "Link copied to clipboard!")
+        self.toast.show("📋 Link copied to clipboard!")
     
     def share_location(self):
         """Share current location."""
         if self.tracker.current_location:
             location = self.tracker.current_location
             share_text = f"📍 I'm at {location['name']}, {location['country']} ({location['lat']:.6f}, {location['lon']:.6f})"
-            self.root.clipboard_clear()
-            self.root.clipboard_append(share_text)
+            self.set_clipboard(share_text)
             self.log_message("📤 Location copied to clipboard")
             messagebox.showinfo("Share", "Location copied to clipboard!")
         else:
@@ -790,23 +993,24 @@ class AdvancedLocationGUI:
     
     def log_message(self, message):
         """Add a message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         
         self.status_text.insert(tk.END, log_entry)
         self.status_text.see(tk.END)
+        self.last_status_display = None  # the widget no longer shows just the status
         
-        # Keep only last 50 lines
-        lines = self.status_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 50:
-            self.status_text.delete(1.0, tk.END)
-            self.status_text.insert(tk.END, '\n'.join(lines[-50:]))
+        # Keep only last 50 lines, trimming by Tk line index
+        line_count = int(self.status_text.index('end-1c').split('.')[0])
+        if line_count > 50:
+            self.status_text.delete('1.0', f'{line_count - 50}.0')
 
 def main():
     """Main function to run the advanced GUI."""
     root = tk.Tk()
     app = AdvancedLocationGUI(root)
     root.mainloop()
+    app.tracker.close()
 
 if __name__ == "__main__":
     main()
@@ -7,9 +7,9 @@ Graphical interface for real-time GPS location tracking.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import queue
 import time
 import json
-from datetime import datetime
 from live_locations import LiveLocationTracker
 
 class LiveLocationGUI:
@@ -24,8 +24,12 @@ class LiveLocationGUI:
         self.tracking_thread = None
         self.is_tracking = False
         
+        # (kind, payload) updates from the tracking thread, applied on the Tk thread
+        self.update_queue = queue.SimpleQueue()
+        
         # Create GUI elements
         self.setup_gui()
+        self.pump_updates()
         
     def setup_gui(self):
         """Setup the GUI interface."""
@@ -69,6 +73,7 @@ class LiveLocationGUI:
         
         # Location info labels
         self.location_labels = {}
+        self.location_vars = {}  # label text, set through StringVar rather than config()
         location_info = [
             ("city", "🌍 City:"),
             ("country", "🏳️ Country:"),
@@ -82,7 +87,9 @@ class LiveLocationGUI:
         
         for i, (key, label) in enumerate(location_info):
             ttk.Label(location_frame, text=label).grid(row=i, column=0, sticky=tk.W, pady=2)
-            self.location_labels[key] = ttk.Label(location_frame, text="--", font=("Arial", 10, "bold"))
+            self.location_vars[key] = tk.StringVar(value="--")
+            self.location_labels[key] = ttk.Label(location_frame, textvariable=self.location_vars[key],
+                                                  font=("Arial", 10, "bold"))
             self.location_labels[key].grid(row=i, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Map-like Display
@@ -99,19 +106,41 @@ class LiveLocationGUI:
         self.map_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         map_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # Grid and title never change, so they are drawn once
+        self.draw_map_chrome()
+        
         # Status Display
         status_frame = ttk.LabelFrame(main_frame, text="Tracking Status", padding="10")
         status_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
         status_frame.columnconfigure(0, weight=1)
-        status_frame.rowconfigure(0, weight=1)
+        status_frame.rowconfigure(1, weight=1)
+        
+        # Status value labels, updated individually when their value changes
+        status_fields = ttk.Frame(status_frame)
+        status_fields.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+        
+        self.status_labels = {}
+        self.last_status = {}
+        status_info = [
+            ("tracking_active", "Active:"),
+            ("current_location", "Current:"),
+            ("total_locations", "Total:"),
+            ("distance_traveled", "Distance:"),
+            ("tracking_interval", "Interval:")
+        ]
         
-        # Status text area
+        for i, (key, label) in enumerate(status_info):
+            ttk.Label(status_fields, text=label).grid(row=0, column=i * 2, sticky=tk.W)
+            self.status_labels[key] = ttk.Label(status_fields, text="--", font=("Arial", 10, "bold"))
+            self.status_labels[key].grid(row=0, column=i * 2 + 1, sticky=tk.W, padx=(5, 15))
+        
+        # Log text area
         self.status_text = tk.Text(status_frame, height=8, width=80, bg='#2a2a2a', fg='#00ff00')
         status_scrollbar = ttk.Scrollbar(status_frame, orient="vertical", command=self.status_text.yview)
         self.status_text.configure(yscrollcommand=status_scrollbar.set)
         
-        self.status_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        status_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        status_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         
         # Initialize display
         self.update_location_display()
@@ -123,7 +152,8 @@ class LiveLocationGUI:
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             
-            # Start tracking in a separate thread
+            # Start tracking in a separate thread; an earlier stop left the stop event set
+            self.tracker.reset_stop()
             self.tracking_thread = threading.Thread(target=self.tracking_loop)
             self.tracking_thread.daemon = True
             self.tracking_thread.start()
@@ -148,53 +178,79 @@ class LiveLocationGUI:
             try:
                 # Get current location
                 location = self.tracker.get_current_location()
-                self.tracker.current_location = location
-                self.tracker.location_history.append(location)
-                
-                # Keep only last 100 locations
-                if len(self.tracker.location_history) > 100:
-                    self.tracker.location_history = self.tracker.location_history[-100:]
+                self.tracker.record_location(location)
                 
                 # Log location
                 self.tracker.log_location(location)
                 
-                # Update GUI
-                self.root.after(0, self.update_location_display)
-                self.root.after(0, self.update_map_display)
+                # Hand the fix to the Tk thread; pump_updates redraws from it
+                self.update_queue.put_nowait(("location", location))
                 
-                # Wait before next update
-                time.sleep(2)
+                # Wait before next update; stop_tracking wakes this immediately
+                self.tracker.wait_for_tick(2)
                 
             except Exception as e:
-                self.root.after(0, self.log_message, f"Error: {str(e)}")
-                time.sleep(1)
+                self.update_queue.put_nowait(("log", f"Error: {str(e)}"))
+                self.tracker.wait_for_tick(1)
                 
+    def pump_updates(self):
+        """Apply queued tracking-thread updates and reschedule itself (Tk thread)."""
+        has_location = False
+        while True:
+            try:
+                kind, payload = self.update_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                self.log_message(payload)
+            else:
+                has_location = True
+        
+        # A burst of fixes is coalesced into one redraw of the latest state
+        if has_location:
+            self.update_location_display()
+            self.update_map_display()
+        
+        self.root.after(500, self.pump_updates)
+    
     def update_location_display(self):
         """Update the location display."""
-        if self.tracker.current_location:
-            location = self.tracker.current_location
+        location = self.tracker.current_location
+        if location:
             info = self.tracker.get_location_info(location)
             
             # Update labels
-            for key, label in self.location_labels.items():
+            for key, var in self.location_vars.items():
                 if key in info:
-                    label.config(text=info[key])
+                    var.set(info[key])
         
-        # Update status
+        # Update status, touching only the labels whose value changed
         status = self.tracker.get_current_status()
-        status_display = f"📊 Tracking Status:\n"
-        status_display += f"Active: {status['tracking_active']}\n"
-        status_display += f"Current: {status['current_location']}\n"
-        status_display += f"Total: {status['total_locations']}\n"
-        status_display += f"Distance: {status['distance_traveled']}\n"
-        status_display += f"Interval: {status['tracking_interval']}"
+        for key, label in self.status_labels.items():
+            value = status[key]
+            if value != self.last_status.get(key):
+                label.config(text=value)
+                self.last_status[key] = value
+        
+    def draw_map_chrome(self):
+        """Draw the static map grid and title, tagged "chrome"."""
+        canvas_width = 800
+        canvas_height = 300
         
-        self.status_text.delete(1.0, tk.END)
-        self.status_text.insert(tk.END, status_display)
+        # Draw grid
+        for i in range(0, canvas_width, 50):
+            self.map_canvas.create_line(i, 0, i, canvas_height, fill='#444444', width=1, tags="chrome")
+        for i in range(0, canvas_height, 50):
+            self.map_canvas.create_line(0, i, canvas_width, i, fill='#444444', width=1, tags="chrome")
         
+        # Add map title
+        self.map_canvas.create_text(canvas_width//2, 20, text="Live Location Map", 
+                                  fill='white', font=('Arial', 12, 'bold'), tags="chrome")
+    
     def update_map_display(self):
         """Update the map-like display."""
-        self.map_canvas.delete("all")
+        # Only the path layer is redrawn; the grid and title stay in place
+        self.map_canvas.delete("path")
         
         if not self.tracker.location_history:
             return
@@ -204,12 +260,6 @@ class LiveLocationGUI:
         canvas_height = 300
         margin = 50
         
-        # Draw grid
-        for i in range(0, canvas_width, 50):
-            self.map_canvas.create_line(i, 0, i, canvas_height, fill='#444444', width=1)
-        for i in range(0, canvas_height, 50):
-            self.map_canvas.create_line(0, i, canvas_width, i, fill='#444444', width=1)
-        
         # Plot recent locations
         recent_locations = self.tracker.get_location_history(10)
         if len(recent_locations) > 1:
@@ -224,19 +274,15 @@ class LiveLocationGUI:
                 color = '#ff0000' if i == len(recent_locations) - 1 else '#00ff00'
                 size = 8 if i == len(recent_locations) - 1 else 4
                 self.map_canvas.create_oval(x-size, y-size, x+size, y+size, 
-                                          fill=color, outline='white')
+                                          fill=color, outline='white', tags="path")
                 
                 # Add location label
                 self.map_canvas.create_text(x, y-15, text=location['name'][:8], 
-                                          fill='white', font=('Arial', 8))
+                                          fill='white', font=('Arial', 8), tags="path")
             
             # Draw path line
             if len(points) >= 4:
-                self.map_canvas.create_line(points, fill='#00ffff', width=2, smooth=True)
-        
-        # Add map title
-        self.map_canvas.create_text(canvas_width//2, 20, text="Live Location Map", 
-                                  fill='white', font=('Arial', 12, 'bold'))
+                self.map_canvas.create_line(points, fill='#00ffff', width=2, smooth=True, tags="path")
         
     def show_status(self):
         """Show detailed tracking status."""
@@ -297,23 +343,23 @@ class LiveLocationGUI:
         
     def log_message(self, message):
         """Add a message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         
         self.status_text.insert(tk.END, log_entry)
         self.status_text.see(tk.END)
         
-        # Keep only last 50 lines
-        lines = self.status_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 50:
-            self.status_text.delete(1.0, tk.END)
-            self.status_text.insert(tk.END, '\n'.join(lines[-50:]))
+        # Keep only last 50 lines, trimming by Tk line index
+        line_count = int(self.status_text.index('end-1c').split('.')[0])
+        if line_count > 50:
+            self.status_text.delete('1.0', f'{line_count - 50}.0')
 
 def main():
     """Main function to run the GUI."""
     root = tk.Tk()
     app = LiveLocationGUI(root)
     root.mainloop()
+    app.tracker.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Log Utilities
+JSON-lines log helpers shared by the location trackers and the Anti GPS System.
+"""
+
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+
+try:
+    import orjson  # optional: faster log serialization
+except ImportError:
+    orjson = None
+
+def json_line(entry):
+    """Serialize a log entry to one newline-terminated line of UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    # Same compact, unescaped UTF-8 that orjson writes, so log lines match either way
+    return (json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+class BackgroundLogWriter:
+    """Append log entries to a JSON-lines file from a background thread."""
+    
+    def __init__(self, path):
+        self.path = path
+        self.entries = queue.Queue()  # entries waiting for the writer thread
+        self.thread = None  # started on the first write call
+    
+    def write(self, entry):
+        """Queue an entry for the writer thread instead of doing file I/O here."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.writer_loop)
+            self.thread.daemon = True
+            self.thread.start()
+        self.entries.put_nowait(entry)
+    
+    def writer_loop(self):
+        """Write queued entries through one buffered file handle."""
+        with open(self.path, "ab", buffering=8192) as f:
+            running = True
+            while running:
+                # Block for one entry, then take everything else already queued
+                batch = [self.entries.get()]
+                try:
+                    while True:
+                        batch.append(self.entries.get_nowait())
+                except queue.Empty:
+                    pass
+                
+                lines = []
+                for entry in batch:
+                    if entry is None:
+                        running = False
+                        break
+                    lines.append(json_line(entry))
+                
+                # One write and one flush per batch of pending entries
+                f.write(b"".join(lines))
+                f.flush()
+    
+    def close(self):
+        """Flush pending entries and stop the writer thread."""
+        if self.thread is not None:
+            self.entries.put(None)
+            self.thread.join()
+            self.thread = None
+
+class IsoClock:
+    """ISO timestamps with microseconds, reformatting the date part only once per second."""
+    
+    def __init__(self):
+        self.cached_second = None  # whole second last formatted by now()
+        self.cached_second_iso = ""
+    
+    def now(self):
+        """Current ISO timestamp."""
+        now = time.time()
+        second = int(now)
+        if second != self.cached_second:
+            self.cached_second = second
+            self.cached_second_iso = datetime.fromtimestamp(second).isoformat()
+        
+        return f"{self.cached_second_iso}.{int((now - second) * 1e6):06d}"
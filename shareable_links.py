@@ -4,10 +4,66 @@ Shareable Links Generator for Location Tracker
 Generate various types of shareable links for GPS locations.
 """
 
-import urllib.parse
 import webbrowser
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+from functools import lru_cache
+from tk_helpers import LazyNotebook, Toast
+
+# Percent-encoding for each byte, using urllib.parse.quote's default safe set
+_QUOTE_SAFE = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+_QUOTE_TABLE = [chr(b) if b in _QUOTE_SAFE else f"%{b:02X}" for b in range(256)]
+
+def _fast_quote(text, _table=_QUOTE_TABLE):
+    """Same result as urllib.parse.quote(text), via a precomputed byte table."""
+    return "".join([_table[b] for b in text.encode("utf-8")])
+
+@lru_cache(maxsize=512, typed=True)  # typed: 40 and 40.0 render differently
+def _build_links(lat, lon, city_name, country, weather, temperature, traffic, speed):
+    """Build the links for one set of location fields; pure, so results are cached."""
+    # Create location description
+    location_desc = f"{city_name}, {country}"
+    location_desc_quoted = _fast_quote(location_desc)
+    
+    # Number strings shared by several links, each formatted once
+    coord_compact = f"{lat},{lon}"
+    coord_str = f"{lat:.6f}, {lon:.6f}"
+    temperature_str = f"{temperature:.1f}"
+    speed_str = f"{speed:.1f}"
+    
+    # Shared Google Maps link, formatted and percent-encoded once
+    maps_url = f"https://maps.google.com/?q={coord_compact}"
+    maps_url_quoted = _fast_quote(maps_url)
+    
+    # Generate different types of shareable links
+    links = {
+        # Map Services
+        "google_maps": f"https://www.google.com/maps?q={coord_compact}",
+        "apple_maps": f"https://maps.apple.com/?q={coord_compact}",
+        "waze": f"https://waze.com/ul?ll={coord_compact}&navigate=yes",
+        "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
+        "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
+        
+        # Social Media
+        "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({coord_str})",
+        "telegram": f"https://t.me/share/url?url={maps_url_quoted}&text=📍 I'm at {location_desc}",
+        "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({coord_str})&url={maps_url_quoted}",
+        "facebook": f"https://www.facebook.com/sharer/sharer.php?u={maps_url_quoted}",
+        "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={maps_url_quoted}",
+        
+        # Communication
+        "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({coord_str})%0A%0AView on Google Maps: {maps_url}",
+        "sms": f"sms:?body=📍 I'm at {location_desc} ({coord_str})",
+        "deep_link": f"geo:{coord_compact}?q={location_desc_quoted}",
+        
+        # Custom Formats
+        "qr_code_data": maps_url,
+        "custom_share": f"📍 I'm at {location_desc} ({coord_str})%0A%0A🌤️ Weather: {weather} | 🌡️ {temperature_str}°C%0A🚦 Traffic: {traffic} | 🚗 {speed_str} km/h%0A%0A🗺️ View on Google Maps: {maps_url}",
+        "short_text": f"📍 {location_desc} ({coord_str})",
+        "detailed_text": f"📍 Location: {location_desc}%0A🌤️ Weather: {weather} | 🌡️ {temperature_str}°C%0A🚦 Traffic: {traffic} | 🚗 {speed_str} km/h%0A🗺️ Maps: {maps_url}"
+    }
+    
+    return links
 
 class ShareableLinksGenerator:
     def __init__(self):
@@ -21,46 +77,12 @@ class ShareableLinksGenerator:
     
     def generate_links(self, location):
         """Generate comprehensive shareable links for a location."""
-        lat, lon = location["lat"], location["lon"]
-        city_name = location["name"]
-        country = location["country"]
-        weather = location.get("weather", "Unknown")
-        temperature = location.get("temperature", 0)
-        traffic = location.get("traffic", "Unknown")
-        speed = location.get("speed", 0)
-        
-        # Create location description
-        location_desc = f"{city_name}, {country}"
-        
-        # Generate different types of shareable links
-        links = {
-            # Map Services
-            "google_maps": f"https://www.google.com/maps?q={lat},{lon}",
-            "apple_maps": f"https://maps.apple.com/?q={lat},{lon}",
-            "waze": f"https://waze.com/ul?ll={lat},{lon}&navigate=yes",
-            "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
-            "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
-            
-            # Social Media
-            "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "telegram": f"https://t.me/share/url?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}&text=📍 I'm at {location_desc}",
-            "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})&url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "facebook": f"https://www.facebook.com/sharer/sharer.php?u={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            
-            # Communication
-            "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0AView on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "sms": f"sms:?body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "deep_link": f"geo:{lat},{lon}?q={urllib.parse.quote(location_desc)}",
-            
-            # Custom Formats
-            "qr_code_data": f"https://maps.google.com/?q={lat},{lon}",
-            "custom_share": f"📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A%0A🗺️ View on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "short_text": f"📍 {location_desc} ({lat:.6f}, {lon:.6f})",
-            "detailed_text": f"📍 Location: {location_desc}%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A🗺️ Maps: https://maps.google.com/?q={lat},{lon}"
-        }
-        
-        return links
+        # Links depend only on these fields, so repeated locations hit the cache
+        return dict(_build_links(
+            location["lat"], location["lon"], location["name"], location["country"],
+            location.get("weather", "Unknown"), location.get("temperature", 0),
+            location.get("traffic", "Unknown"), location.get("speed", 0)
+        ))
     
     def open_link(self, url):
         """Open a link in the default browser."""
@@ -77,7 +99,7 @@ class ShareableLinksGenerator:
             root.clipboard_clear()
             root.clipboard_append(text)
             return True
-        except Exception as e:
+        except tk.TclError as e:  # the only failure Tk raises here
             print(f"Error copying to clipboard: {e}")
             return False
 
@@ -119,26 +141,24 @@ class ShareableLinksGUI:
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Maps tab
-        self.create_maps_tab(notebook)
-        
-        # Social Media tab
-        self.create_social_tab(notebook)
-        
-        # Communication tab
-        self.create_communication_tab(notebook)
-        
-        # Custom tab
-        self.create_custom_tab(notebook)
+        # Tabs start empty and are filled the first time they are selected
+        tabs = LazyNotebook(notebook)
+        tabs.add(ttk.Frame(notebook), "🗺️ Maps", self.create_maps_tab)
+        tabs.add(ttk.Frame(notebook), "📱 Social", self.create_social_tab)
+        tabs.add(ttk.Frame(notebook), "📧 Communication", self.create_communication_tab)
+        tabs.add(ttk.Frame(notebook), "📤 Custom", self.create_custom_tab)
+        tabs.build_selected()
         
         # Quick actions
         self.create_quick_actions(main_frame)
+        
+        # Non-blocking feedback for open/copy actions
+        toast_label = ttk.Label(main_frame, text="")
+        toast_label.pack(pady=(10, 0))
+        self.toast = Toast(toast_label)
     
-    def create_maps_tab(self, notebook):
+    def create_maps_tab(self, maps_frame):
         """Create the maps tab."""
-        maps_frame = ttk.Frame(notebook)
-        notebook.add(maps_frame, text="🗺️ Maps")
-        
         maps_links = [
             ("Google Maps", self.links["google_maps"], "🌐"),
             ("Apple Maps", self.links["apple_maps"], "🍎"),
@@ -147,20 +167,10 @@ class ShareableLinksGUI:
             ("OpenStreetMap", self.links["openstreetmap"], "🗺️")
         ]
         
-        for name, url, icon in maps_links:
-            frame = ttk.Frame(maps_frame)
-            frame.pack(fill=tk.X, pady=2, padx=10)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: self.open_link(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_link(u)).pack(side=tk.RIGHT, padx=(0, 5))
+        self.populate_link_rows(maps_frame, maps_links)
     
-    def create_social_tab(self, notebook):
+    def create_social_tab(self, social_frame):
         """Create the social media tab."""
-        social_frame = ttk.Frame(notebook)
-        notebook.add(social_frame, text="📱 Social")
-        
         social_links = [
             ("WhatsApp", self.links["whatsapp"], "💬"),
             ("Telegram", self.links["telegram"], "📱"),
@@ -169,40 +179,36 @@ class ShareableLinksGUI:
             ("LinkedIn", self.links["linkedin"], "💼")
         ]
         
-        for name, url, icon in social_links:
-            frame = ttk.Frame(social_frame)
-            frame.pack(fill=tk.X, pady=2, padx=10)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: self.open_link(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_link(u)).pack(side=tk.RIGHT, padx=(0, 5))
+        self.populate_link_rows(social_frame, social_links)
     
-    def create_communication_tab(self, notebook):
+    def create_communication_tab(self, comm_frame):
         """Create the communication tab."""
-        comm_frame = ttk.Frame(notebook)
-        notebook.add(comm_frame, text="📧 Communication")
-        
         comm_links = [
             ("Email", self.links["email"], "📧"),
             ("SMS", self.links["sms"], "💬"),
             ("Deep Link", self.links["deep_link"], "🔗")
         ]
         
-        for name, url, icon in comm_links:
-            frame = ttk.Frame(comm_frame)
-            frame.pack(fill=tk.X, pady=2, padx=10)
-            ttk.Label(frame, text=f"{icon} {name}").pack(side=tk.LEFT)
-            ttk.Button(frame, text="🔗 Open", 
-                      command=lambda u=url: self.open_link(u)).pack(side=tk.RIGHT)
-            ttk.Button(frame, text="📋 Copy", 
-                      command=lambda u=url: self.copy_link(u)).pack(side=tk.RIGHT, padx=(0, 5))
+        self.populate_link_rows(comm_frame, comm_links)
     
-    def create_custom_tab(self, notebook):
-        """Create the custom sharing tab."""
-        custom_frame = ttk.Frame(notebook)
-        notebook.add(custom_frame, text="📤 Custom")
+    def populate_link_rows(self, parent, rows):
+        """Add an Open/Copy row to parent for each (name, url, icon) entry."""
+        # Module lookups hoisted out of the per-row loop
+        Frame, Label, Button = ttk.Frame, ttk.Label, ttk.Button
+        LEFT, RIGHT, X = tk.LEFT, tk.RIGHT, tk.X
+        open_link, copy_link = self.open_link, self.copy_link
         
+        for name, url, icon in rows:
+            frame = Frame(parent)
+            frame.pack(fill=X, pady=2, padx=10)
+            Label(frame, text=f"{icon} {name}").pack(side=LEFT)
+            Button(frame, text="🔗 Open", 
+                   command=lambda u=url: open_link(u)).pack(side=RIGHT)
+            Button(frame, text="📋 Copy", 
+                   command=lambda u=url: copy_link(u)).pack(side=RIGHT, padx=(0, 5))
+    
+    def create_custom_tab(self, custom_frame):
+        """Create the custom sharing tab."""
         # Custom share text
         custom_text = tk.Text(custom_frame, height=8, width=70)
         custom_text.pack(pady=10, padx=10)
@@ -250,23 +256,23 @@ class ShareableLinksGUI:
     def open_link(self, url):
         """Open a link in the browser."""
         if self.generator.open_link(url):
-            messagebox.showinfo("Success", "Link opened in browser!")
+            self.toast.show("✅ Link opened in browser!")
         else:
-            messagebox.showerror("Error", "Failed to open link")
+            self.toast.show("❌ Failed to open link")
     
     def copy_link(self, url):
         """Copy a link to clipboard."""
         if self.generator.copy_to_clipboard(url, self.root):
-            messagebox.showinfo("Success", "Link copied to clipboard!")
+            self.toast.show("✅ Link copied to clipboard!")
         else:
-            messagebox.showerror("Error", "Failed to copy link")
+            self.toast.show("❌ Failed to copy link")
     
     def copy_text(self, text):
         """Copy text to clipboard."""
         if self.generator.copy_to_clipboard(text, self.root):
-            messagebox.showinfo("Success", "Text copied to clipboard!")
+            self.toast.show("✅ Text copied to clipboard!")
         else:
-            messagebox.showerror("Error", "Failed to copy text")
+            self.toast.show("❌ Failed to copy text")
 
 def demo_shareable_links():
     """Demo function to test shareable links."""
@@ -4,115 +4,221 @@ Enhanced Shareable Links Generator
 Advanced GPS location sharing with analytics, export, and additional platforms.
 """
 
-import urllib.parse
+from urllib.parse import quote as _urlquote
 import webbrowser
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
+import csv
+import io
+from functools import partial, lru_cache
 from datetime import datetime
+from tk_helpers import LazyNotebook
+
+# Professional color scheme
+COLORS = {
+    "primary": "#2563eb",      # Blue
+    "secondary": "#64748b",     # Slate
+    "success": "#059669",       # Green
+    "warning": "#d97706",       # Orange
+    "danger": "#dc2626",        # Red
+    "dark": "#1e293b",          # Dark slate
+    "light": "#f8fafc",         # Light gray
+    "white": "#ffffff",         # White
+    "accent": "#7c3aed",        # Purple
+    "gradient_start": "#3b82f6", # Blue gradient
+    "gradient_end": "#1d4ed8"   # Darker blue
+}
+
+# Fonts shared by every widget
+FONT_TITLE = ("Segoe UI", 24, "bold")
+FONT_HEADER = ("Segoe UI", 16, "bold")
+FONT_SUBHEADER = ("Segoe UI", 14, "bold")
+FONT_LABEL = ("Segoe UI", 12, "bold")
+FONT_BODY = ("Segoe UI", 12)
+FONT_SMALL = ("Segoe UI", 11)
+FONT_ICON = ("Segoe UI", 16)
+FONT_BUTTON = ("Segoe UI", 10, "bold")
+FONT_CODE = ("Consolas", 10)
+
+@lru_cache(maxsize=128, typed=True)  # typed: the map URLs print lat/lon as passed in
+def _build_links(lat, lon, city_name, country, weather, temperature, traffic, speed,
+                 _quote=_urlquote):
+    """Build every shareable link from plain location fields; pure, so results are cached."""
+    # Create location description; quoted values are query parameters, so
+    # safe="" encodes "/" as well
+    location_desc = f"{city_name}, {country}"
+    location_desc_quoted = _quote(location_desc, safe="")
+    coord_str = f"{lat:.6f}, {lon:.6f}"
+    
+    # Shared Google Maps link, formatted and percent-encoded once
+    maps_url = f"https://maps.google.com/?q={lat},{lon}"
+    maps_url_quoted = _quote(maps_url, safe="")
+    
+    # Generate different types of shareable links
+    links = {
+        # Map Services
+        "google_maps": f"https://www.google.com/maps?q={lat},{lon}",
+        "apple_maps": f"https://maps.apple.com/?q={lat},{lon}",
+        "waze": f"https://waze.com/ul?ll={lat},{lon}&navigate=yes",
+        "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
+        "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
+        "here_maps": f"https://wego.here.com/location?map=lat,{lat},lon,{lon}",
+        
+        # Social Media
+        "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({coord_str})",
+        "telegram": f"https://t.me/share/url?url={maps_url_quoted}&text=📍 I'm at {location_desc}",
+        "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({coord_str})&url={maps_url_quoted}",
+        "facebook": f"https://www.facebook.com/sharer/sharer.php?u={maps_url_quoted}",
+        "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={maps_url_quoted}",
+        "instagram": f"https://www.instagram.com/?url={maps_url_quoted}",
+        "discord": f"https://discord.com/channels/@me?content=📍 I'm at {location_desc} ({coord_str})",
+        
+        # Communication
+        "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({coord_str})%0A%0AView on Google Maps: {maps_url}",
+        "sms": f"sms:?body=📍 I'm at {location_desc} ({coord_str})",
+        "deep_link": f"geo:{lat},{lon}?q={location_desc_quoted}",
+        "skype": f"skype:?chat&topic=📍 I'm at {location_desc}",
+        
+        # Custom Formats
+        "qr_code_data": maps_url,
+        "custom_share": f"📍 I'm at {location_desc} ({coord_str})%0A%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A%0A🗺️ View on Google Maps: {maps_url}",
+        "short_text": f"📍 {location_desc} ({coord_str})",
+        "detailed_text": f"📍 Location: {location_desc}%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A🗺️ Maps: {maps_url}",
+        "rich_text": f"<h3>📍 My Location</h3><p><strong>{location_desc}</strong></p><p>Coordinates: {coord_str}</p><p>Weather: {weather} | Temperature: {temperature:.1f}°C</p><p>Traffic: {traffic} | Speed: {speed:.1f} km/h</p><p><a href='{maps_url}'>View on Google Maps</a></p>"
+    }
+    
+    return links
+
+@lru_cache(maxsize=64)
+def _lighten_color(color):
+    """Add 30 to each RGB channel of a #rrggbb color, saturating at 255."""
+    if color.startswith("#"):
+        # One hex parse for all three channels
+        v = int(color[1:], 16)
+        r, g, b = v >> 16, (v >> 8) & 0xFF, v & 0xFF
+        r = r + 30 if r < 226 else 255
+        g = g + 30 if g < 226 else 255
+        b = b + 30 if b < 226 else 255
+        return "#%06x" % ((r << 16) | (g << 8) | b)
+    return color
+
+class SharingAnalytics:
+    """Click, share and copy counters kept by a generator."""
+    __slots__ = ("clicks", "shares", "copies")
+    
+    def __init__(self):
+        self.clicks = 0
+        self.shares = 0
+        self.copies = 0
+    
+    def as_dict(self):
+        """Counters as a plain dict, e.g. for the JSON export."""
+        return {"clicks": self.clicks, "shares": self.shares, "copies": self.copies}
 
 class EnhancedShareableLinksGenerator:
     def __init__(self):
         """Initialize the enhanced shareable links generator."""
-        # Professional color scheme
-        self.colors = {
-            "primary": "#2563eb",      # Blue
-            "secondary": "#64748b",     # Slate
-            "success": "#059669",       # Green
-            "warning": "#d97706",       # Orange
-            "danger": "#dc2626",        # Red
-            "dark": "#1e293b",          # Dark slate
-            "light": "#f8fafc",         # Light gray
-            "white": "#ffffff",         # White
-            "accent": "#7c3aed",        # Purple
-            "gradient_start": "#3b82f6", # Blue gradient
-            "gradient_end": "#1d4ed8"   # Darker blue
-        }
+        # Professional color scheme, shared module-wide
+        self.colors = COLORS
         
         # Analytics tracking
-        self.analytics = {"clicks": 0, "shares": 0, "copies": 0}
+        self.analytics = SharingAnalytics()
     
     def generate_links(self, location):
         """Generate comprehensive shareable links for a location."""
-        lat, lon = location["lat"], location["lon"]
-        city_name = location["name"]
-        country = location["country"]
-        weather = location.get("weather", "Unknown")
-        temperature = location.get("temperature", 0)
-        traffic = location.get("traffic", "Unknown")
-        speed = location.get("speed", 0)
-        
-        # Create location description
-        location_desc = f"{city_name}, {country}"
-        
-        # Generate different types of shareable links
-        links = {
-            # Map Services
-            "google_maps": f"https://www.google.com/maps?q={lat},{lon}",
-            "apple_maps": f"https://maps.apple.com/?q={lat},{lon}",
-            "waze": f"https://waze.com/ul?ll={lat},{lon}&navigate=yes",
-            "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
-            "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
-            "here_maps": f"https://wego.here.com/location?map=lat,{lat},lon,{lon}",
-            
-            # Social Media
-            "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "telegram": f"https://t.me/share/url?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}&text=📍 I'm at {location_desc}",
-            "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})&url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "facebook": f"https://www.facebook.com/sharer/sharer.php?u={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "instagram": f"https://www.instagram.com/?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "discord": f"https://discord.com/channels/@me?content=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            
-            # Communication
-            "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0AView on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "sms": f"sms:?body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "deep_link": f"geo:{lat},{lon}?q={urllib.parse.quote(location_desc)}",
-            "skype": f"skype:?chat&topic=📍 I'm at {location_desc}",
-            
-            # Custom Formats
-            "qr_code_data": f"https://maps.google.com/?q={lat},{lon}",
-            "custom_share": f"📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A%0A🗺️ View on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "short_text": f"📍 {location_desc} ({lat:.6f}, {lon:.6f})",
-            "detailed_text": f"📍 Location: {location_desc}%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A🗺️ Maps: https://maps.google.com/?q={lat},{lon}",
-            "rich_text": f"<h3>📍 My Location</h3><p><strong>{location_desc}</strong></p><p>Coordinates: {lat:.6f}, {lon:.6f}</p><p>Weather: {weather} | Temperature: {temperature:.1f}°C</p><p>Traffic: {traffic} | Speed: {speed:.1f} km/h</p><p><a href='https://maps.google.com/?q={lat},{lon}'>View on Google Maps</a></p>"
-        }
-        
-        return links
+        # Copied so callers can't modify the cached dict
+        return dict(_build_links(
+            location["lat"], location["lon"], location["name"], location["country"],
+            location.get("weather", "Unknown"), location.get("temperature", 0),
+            location.get("traffic", "Unknown"), location.get("speed", 0)
+        ))
     
-    def export_data(self, location_data, links, format_type="json"):
-        """Export location and links data."""
-        export_data = {
-            "timestamp": datetime.now().isoformat(),
-            "location": location_data,
-            "links": links,
-            "analytics": self.analytics
-        }
-        
+    def generate_links_batch(self, locations):
+        """Generate links for several locations in one pass, e.g. for a bulk export."""
+        return [self.generate_links(location) for location in locations]
+    
+    def export_data(self, location_data, links, format_type="json", pretty=False, timestamp=None):
+        """Export location and links data; pretty indents JSON for reading."""
+        # Each format reads only what it needs from the location and links
         if format_type == "json":
-            return json.dumps(export_data, indent=2)
+            return self.export_json(location_data, links, pretty, timestamp)
         elif format_type == "csv":
-            csv_data = "Platform,URL\n"
-            for platform, url in links.items():
-                csv_data += f"{platform},{url}\n"
-            return csv_data
+            return self.export_csv(links)
         elif format_type == "txt":
-            txt_data = f"Location: {location_data['name']}, {location_data['country']}\n"
-            txt_data += f"Coordinates: {location_data['lat']:.6f}, {location_data['lon']:.6f}\n"
-            txt_data += f"Weather: {location_data.get('weather', 'Unknown')}\n"
-            txt_data += f"Temperature: {location_data.get('temperature', 0):.1f}°C\n\n"
-            txt_data += "Shareable Links:\n"
-            for platform, url in links.items():
-                txt_data += f"{platform}: {url}\n"
-            return txt_data
+            return self.export_txt(location_data, links)
         
-        return export_data
+        raise ValueError(f"Unknown export format: {format_type}")
+    
+    def export_record(self, location_data, links, timestamp=None):
+        """The record serialized by the JSON export; timestamp defaults to now."""
+        return {
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "location": location_data,
+            "links": links,
+            "analytics": self.analytics.as_dict()
+        }
+    
+    def export_json(self, location_data, links, pretty=False, timestamp=None):
+        """Serialize the location, links and analytics as JSON."""
+        record = self.export_record(location_data, links, timestamp)
+        if pretty:
+            return json.dumps(record, indent=2)
+        return json.dumps(record, separators=(',', ':'))
+    
+    def write_json(self, path, location_data, links, pretty=False, timestamp=None):
+        """Write the JSON export to a file."""
+        # json.dump would stream, but only json.dumps gets the C encoder
+        with open(path, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(self.export_json(location_data, links, pretty, timestamp))
+    
+    def export_csv(self, links):
+        """Serialize the links as Platform,URL CSV rows."""
+        buffer = io.StringIO(newline="")
+        self.write_csv_rows(buffer, links)
+        return buffer.getvalue()
+    
+    def export_txt(self, location_data, links):
+        """Serialize a readable location summary followed by the links."""
+        lines = [
+            f"Location: {location_data['name']}, {location_data['country']}",
+            f"Coordinates: {location_data['lat']:.6f}, {location_data['lon']:.6f}",
+            f"Weather: {location_data.get('weather', 'Unknown')}",
+            f"Temperature: {location_data.get('temperature', 0):.1f}°C",
+            "",
+            "Shareable Links:"
+        ]
+        lines.extend(f"{platform}: {url}" for platform, url in links.items())
+        return "\n".join(lines) + "\n"
+    
+    def write_csv_rows(self, stream, links):
+        """Write the CSV header and one row per link; csv quotes URLs containing commas."""
+        writer = csv.writer(stream)
+        writer.writerow(["Platform", "URL"])
+        writer.writerows(links.items())
+    
+    def write_csv(self, path, links):
+        """Write the links as CSV straight to a file, without building the text first."""
+        with open(path, 'w', encoding='utf-8', newline='', buffering=65536) as f:
+            self.write_csv_rows(f, links)
+    
+    def bulk_export_csv(self, path, locations):
+        """Stream one Location,Platform,URL row per link for every location into a CSV file."""
+        # Each location's links are generated only when the writer reaches its rows
+        generate = self.generate_links
+        rows = ((f"{location['name']}, {location['country']}", platform, url)
+                for location in locations
+                for platform, url in generate(location).items())
+        with open(path, 'w', encoding='utf-8', newline='', buffering=65536) as f:
+            writer = csv.writer(f)
+            writer.writerow(["Location", "Platform", "URL"])
+            writer.writerows(rows)
     
     def open_link(self, url):
         """Open a link in the default browser."""
         try:
             webbrowser.open(url)
-            self.analytics["clicks"] += 1
+            self.analytics.clicks += 1
             return True
         except Exception as e:
             print(f"Error opening link: {e}")
@@ -123,7 +229,7 @@ class EnhancedShareableLinksGenerator:
         try:
             root.clipboard_clear()
             root.clipboard_append(text)
-            self.analytics["copies"] += 1
+            self.analytics.copies += 1
             return True
         except Exception as e:
             print(f"Error copying to clipboard: {e}")
@@ -165,7 +271,7 @@ class EnhancedShareableLinksGUI:
         # Title with modern styling
         title_label = tk.Label(header_frame, 
                               text="🔗 Enhanced Location Sharing Pro",
-                              font=("Segoe UI", 24, "bold"),
+                              font=FONT_TITLE,
                               fg=self.colors["white"],
                               bg=self.colors["gradient_start"])
         title_label.pack(expand=True)
@@ -177,20 +283,15 @@ class EnhancedShareableLinksGUI:
         notebook = ttk.Notebook(main_frame)
         notebook.grid(row=2, column=0, sticky="nsew", pady=(20, 0))
         
-        # Maps tab
-        self.create_maps_tab(notebook)
-        
-        # Social Media tab
-        self.create_social_tab(notebook)
-        
-        # Communication tab
-        self.create_communication_tab(notebook)
-        
-        # Custom tab
-        self.create_custom_tab(notebook)
-        
-        # Analytics tab
-        self.create_analytics_tab(notebook)
+        # Tabs start empty and are filled the first time they are selected
+        tabs = LazyNotebook(notebook)
+        for title, builder in (("🗺️ Maps", self.create_maps_tab),
+                               ("📱 Social", self.create_social_tab),
+                               ("📧 Communication", self.create_communication_tab),
+                               ("📤 Custom", self.create_custom_tab),
+                               ("📊 Analytics", self.create_analytics_tab)):
+            tabs.add(tk.Frame(notebook, bg=self.colors["light"]), title, builder)
+        tabs.build_selected()
         
         # Quick actions
         self.create_quick_actions(main_frame)
@@ -203,7 +304,7 @@ class EnhancedShareableLinksGUI:
         # Card header
         header_label = tk.Label(card_frame, 
                                text="📍 Current Location",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["white"])
         header_label.pack(pady=(15, 10))
@@ -214,7 +315,7 @@ class EnhancedShareableLinksGUI:
         # City and country
         city_label = tk.Label(card_frame,
                              text=f"🌍 {location['name']}, {location['country']}",
-                             font=("Segoe UI", 14, "bold"),
+                             font=FONT_SUBHEADER,
                              fg=self.colors["primary"],
                              bg=self.colors["white"])
         city_label.pack(pady=2)
@@ -222,7 +323,7 @@ class EnhancedShareableLinksGUI:
         # Coordinates
         coords_label = tk.Label(card_frame,
                                text=f"📍 {location['lat']:.6f}, {location['lon']:.6f}",
-                               font=("Segoe UI", 12),
+                               font=FONT_BODY,
                                fg=self.colors["secondary"],
                                bg=self.colors["white"])
         coords_label.pack(pady=2)
@@ -233,14 +334,14 @@ class EnhancedShareableLinksGUI:
         
         weather_label = tk.Label(weather_frame,
                                 text=f"🌤️ {location.get('weather', 'Unknown')} | 🌡️ {location.get('temperature', 0):.1f}°C",
-                                font=("Segoe UI", 11),
+                                font=FONT_SMALL,
                                 fg=self.colors["success"],
                                 bg=self.colors["white"])
         weather_label.pack(side=tk.LEFT, padx=(0, 20))
         
         traffic_label = tk.Label(weather_frame,
                                 text=f"🚦 {location.get('traffic', 'Unknown')} | 🚗 {location.get('speed', 0):.1f} km/h",
-                                font=("Segoe UI", 11),
+                                font=FONT_SMALL,
                                 fg=self.colors["warning"],
                                 bg=self.colors["white"])
         traffic_label.pack(side=tk.LEFT)
@@ -248,15 +349,12 @@ class EnhancedShareableLinksGUI:
         # Bottom padding
         tk.Label(card_frame, bg=self.colors["white"]).pack(pady=15)
     
-    def create_maps_tab(self, notebook):
+    def create_maps_tab(self, maps_frame):
         """Create the maps tab with professional styling."""
-        maps_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(maps_frame, text="🗺️ Maps")
-        
         # Tab header
         header_label = tk.Label(maps_frame,
                                text="🗺️ Map Services",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["light"])
         header_label.pack(pady=(20, 15))
@@ -273,15 +371,12 @@ class EnhancedShareableLinksGUI:
         for name, url, icon, color in maps_links:
             self.create_link_card(maps_frame, name, url, icon, color)
     
-    def create_social_tab(self, notebook):
+    def create_social_tab(self, social_frame):
         """Create the social media tab."""
-        social_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(social_frame, text="📱 Social")
-        
         # Tab header
         header_label = tk.Label(social_frame,
                                text="📱 Social Media",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["light"])
         header_label.pack(pady=(20, 15))
@@ -299,15 +394,12 @@ class EnhancedShareableLinksGUI:
         for name, url, icon, color in social_links:
             self.create_link_card(social_frame, name, url, icon, color)
     
-    def create_communication_tab(self, notebook):
+    def create_communication_tab(self, comm_frame):
         """Create the communication tab."""
-        comm_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(comm_frame, text="📧 Communication")
-        
         # Tab header
         header_label = tk.Label(comm_frame,
                                text="📧 Communication Tools",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["light"])
         header_label.pack(pady=(20, 15))
@@ -322,15 +414,12 @@ class EnhancedShareableLinksGUI:
         for name, url, icon, color in comm_links:
             self.create_link_card(comm_frame, name, url, icon, color)
     
-    def create_custom_tab(self, notebook):
+    def create_custom_tab(self, custom_frame):
         """Create the custom sharing tab."""
-        custom_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(custom_frame, text="📤 Custom")
-        
         # Tab header
         header_label = tk.Label(custom_frame,
                                text="📤 Custom Sharing",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["light"])
         header_label.pack(pady=(20, 15))
@@ -342,7 +431,7 @@ class EnhancedShareableLinksGUI:
         custom_text = tk.Text(text_frame, 
                              height=8, 
                              width=70,
-                             font=("Consolas", 10),
+                             font=FONT_CODE,
                              bg=self.colors["white"],
                              fg=self.colors["dark"],
                              relief="flat",
@@ -360,16 +449,16 @@ class EnhancedShareableLinksGUI:
                                       self.colors["primary"])
         
         self.create_professional_button(custom_buttons, "🔗 Copy Google Maps Link", 
-                                      lambda: self.copy_link(self.links["google_maps"]),
+                                      partial(self.copy_link, self.links["google_maps"]),
                                       self.colors["success"])
         
         self.create_professional_button(custom_buttons, "📱 Copy QR Code Data", 
-                                      lambda: self.copy_link(self.links["qr_code_data"]),
+                                      partial(self.copy_link, self.links["qr_code_data"]),
                                       self.colors["accent"])
         
         # Additional custom formats
         formats_frame = tk.LabelFrame(custom_frame, text="📝 Custom Formats", 
-                                     font=("Segoe UI", 12, "bold"),
+                                     font=FONT_LABEL,
                                      bg=self.colors["light"],
                                      fg=self.colors["dark"])
         formats_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -378,26 +467,23 @@ class EnhancedShareableLinksGUI:
         formats_buttons.pack(pady=10)
         
         self.create_professional_button(formats_buttons, "📋 Short Text", 
-                                      lambda: self.copy_text(self.links["short_text"]),
+                                      partial(self.copy_text, self.links["short_text"]),
                                       self.colors["primary"])
         
         self.create_professional_button(formats_buttons, "📋 Detailed Text", 
-                                      lambda: self.copy_text(self.links["detailed_text"]),
+                                      partial(self.copy_text, self.links["detailed_text"]),
                                       self.colors["success"])
         
         self.create_professional_button(formats_buttons, "📋 Rich Text", 
-                                      lambda: self.copy_text(self.links["rich_text"]),
+                                      partial(self.copy_text, self.links["rich_text"]),
                                       self.colors["accent"])
     
-    def create_analytics_tab(self, notebook):
+    def create_analytics_tab(self, analytics_frame):
         """Create the analytics tab."""
-        analytics_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(analytics_frame, text="📊 Analytics")
-        
         # Tab header
         header_label = tk.Label(analytics_frame,
                                text="📊 Sharing Analytics",
-                               font=("Segoe UI", 16, "bold"),
+                               font=FONT_HEADER,
                                fg=self.colors["dark"],
                                bg=self.colors["light"])
         header_label.pack(pady=(20, 15))
@@ -410,11 +496,11 @@ class EnhancedShareableLinksGUI:
         clicks_card = tk.Frame(analytics_cards, bg=self.colors["white"], relief="solid", bd=1)
         clicks_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        tk.Label(clicks_card, text="🔗 Link Clicks", font=("Segoe UI", 12, "bold"),
+        tk.Label(clicks_card, text="🔗 Link Clicks", font=FONT_LABEL,
                 bg=self.colors["white"], fg=self.colors["primary"]).pack(pady=10)
         
-        clicks_label = tk.Label(clicks_card, text=str(self.generator.analytics["clicks"]),
-                               font=("Segoe UI", 24, "bold"),
+        clicks_label = tk.Label(clicks_card, text=str(self.generator.analytics.clicks),
+                               font=FONT_TITLE,
                                bg=self.colors["white"], fg=self.colors["primary"])
         clicks_label.pack(pady=10)
         
@@ -422,11 +508,11 @@ class EnhancedShareableLinksGUI:
         shares_card = tk.Frame(analytics_cards, bg=self.colors["white"], relief="solid", bd=1)
         shares_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        tk.Label(shares_card, text="📤 Shares", font=("Segoe UI", 12, "bold"),
+        tk.Label(shares_card, text="📤 Shares", font=FONT_LABEL,
                 bg=self.colors["white"], fg=self.colors["success"]).pack(pady=10)
         
-        shares_label = tk.Label(shares_card, text=str(self.generator.analytics["shares"]),
-                               font=("Segoe UI", 24, "bold"),
+        shares_label = tk.Label(shares_card, text=str(self.generator.analytics.shares),
+                               font=FONT_TITLE,
                                bg=self.colors["white"], fg=self.colors["success"])
         shares_label.pack(pady=10)
         
@@ -434,11 +520,11 @@ class EnhancedShareableLinksGUI:
         copies_card = tk.Frame(analytics_cards, bg=self.colors["white"], relief="solid", bd=1)
         copies_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        tk.Label(copies_card, text="📋 Copies", font=("Segoe UI", 12, "bold"),
+        tk.Label(copies_card, text="📋 Copies", font=FONT_LABEL,
                 bg=self.colors["white"], fg=self.colors["warning"]).pack(pady=10)
         
-        copies_label = tk.Label(copies_card, text=str(self.generator.analytics["copies"]),
-                               font=("Segoe UI", 24, "bold"),
+        copies_label = tk.Label(copies_card, text=str(self.generator.analytics.copies),
+                               font=FONT_TITLE,
                                bg=self.colors["white"], fg=self.colors["warning"])
         copies_label.pack(pady=10)
         
@@ -447,53 +533,41 @@ class EnhancedShareableLinksGUI:
         export_frame.pack(pady=20)
         
         self.create_professional_button(export_frame, "📊 Export JSON", 
-                                      lambda: self.export_data("json"),
+                                      partial(self.export_data, "json"),
                                       self.colors["primary"])
         
         self.create_professional_button(export_frame, "📊 Export CSV", 
-                                      lambda: self.export_data("csv"),
+                                      partial(self.export_data, "csv"),
                                       self.colors["success"])
         
         self.create_professional_button(export_frame, "📊 Export TXT", 
-                                      lambda: self.export_data("txt"),
+                                      partial(self.export_data, "txt"),
                                       self.colors["accent"])
     
     def create_link_card(self, parent, name, url, icon, color):
         """Create a professional link card."""
-        card_frame = tk.Frame(parent, 
-                             bg=self.colors["white"], 
-                             relief="solid", 
-                             bd=1)
+        # Card look comes from the ttk styles set up in apply_styles
+        card_frame = ttk.Frame(parent, style="Card.TFrame")
         card_frame.pack(fill=tk.X, padx=20, pady=5)
         
         # Card content
-        content_frame = tk.Frame(card_frame, bg=self.colors["white"])
+        content_frame = ttk.Frame(card_frame, style="CardContent.TFrame")
         content_frame.pack(fill=tk.X, padx=15, pady=10)
         
         # Icon and name
-        icon_label = tk.Label(content_frame,
-                             text=icon,
-                             font=("Segoe UI", 16),
-                             bg=self.colors["white"])
-        icon_label.pack(side=tk.LEFT)
-        
-        name_label = tk.Label(content_frame,
-                             text=name,
-                             font=("Segoe UI", 12, "bold"),
-                             fg=self.colors["dark"],
-                             bg=self.colors["white"])
-        name_label.pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Label(content_frame, text=icon, style="CardIcon.TLabel").pack(side=tk.LEFT)
+        ttk.Label(content_frame, text=name, style="CardName.TLabel").pack(side=tk.LEFT, padx=(10, 0))
         
         # Buttons
-        button_frame = tk.Frame(content_frame, bg=self.colors["white"])
+        button_frame = ttk.Frame(content_frame, style="CardContent.TFrame")
         button_frame.pack(side=tk.RIGHT)
         
         self.create_professional_button(button_frame, "🔗 Open", 
-                                      lambda: self.open_link(url),
+                                      partial(self.open_link, url),
                                       color)
         
         self.create_professional_button(button_frame, "📋 Copy", 
-                                      lambda: self.copy_link(url),
+                                      partial(self.copy_link, url),
                                       self.colors["secondary"])
     
     def create_professional_button(self, parent, text, command, color):
@@ -501,7 +575,7 @@ class EnhancedShareableLinksGUI:
         button = tk.Button(parent,
                           text=text,
                           command=command,
-                          font=("Segoe UI", 10, "bold"),
+                          font=FONT_BUTTON,
                           fg=self.colors["white"],
                           bg=color,
                           relief="flat",
@@ -510,24 +584,16 @@ class EnhancedShareableLinksGUI:
                           cursor="hand2")
         button.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Hover effects
-        button.bind("<Enter>", lambda e: button.configure(bg=self.lighten_color(color)))
-        button.bind("<Leave>", lambda e: button.configure(bg=color))
+        # Hover effects; the hover color is worked out once per button
+        hover = self.lighten_color(color)
+        button.bind("<Enter>", lambda e, b=button, h=hover: b.configure(bg=h))
+        button.bind("<Leave>", lambda e, b=button, c=color: b.configure(bg=c))
         
         return button
     
     def lighten_color(self, color):
         """Lighten a color for hover effects."""
-        # Simple color lightening for hover effect
-        if color.startswith("#"):
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            r = min(255, r + 30)
-            g = min(255, g + 30)
-            b = min(255, b + 30)
-            return f"#{r:02x}{g:02x}{b:02x}"
-        return color
+        return _lighten_color(color)
     
     def create_quick_actions(self, parent):
         """Create professional quick action buttons."""
@@ -537,7 +603,7 @@ class EnhancedShareableLinksGUI:
         # Quick actions header
         header_label = tk.Label(quick_frame,
                                text="⚡ Quick Actions",
-                               font=("Segoe UI", 14, "bold"),
+                               font=FONT_SUBHEADER,
                                fg=self.colors["white"],
                                bg=self.colors["dark"])
         header_label.pack(pady=(0, 15))
@@ -555,7 +621,7 @@ class EnhancedShareableLinksGUI:
         
         for text, url, color in quick_actions:
             self.create_professional_button(actions_frame, text, 
-                                          lambda u=url: self.open_link(u), color)
+                                          partial(self.open_link, url), color)
     
     def apply_styles(self):
         """Apply professional styles to the application."""
@@ -569,17 +635,29 @@ class EnhancedShareableLinksGUI:
                        borderwidth=0)
         style.configure('TNotebook.Tab', 
                        padding=[20, 10],
-                       font=('Segoe UI', 10, 'bold'))
+                       font=FONT_BUTTON)
         style.map('TNotebook.Tab',
                  background=[('selected', self.colors["primary"]),
                            ('active', self.colors["secondary"])],
                  foreground=[('selected', self.colors["white"]),
                            ('active', self.colors["white"])])
+        
+        # Link card styles, shared by every card instead of per-widget options
+        style.configure('Card.TFrame',
+                       background=self.colors["white"],
+                       relief="solid",
+                       borderwidth=1)
+        style.configure('CardContent.TFrame', background=self.colors["white"])
+        style.configure('CardIcon.TLabel',
+                       font=FONT_ICON,
+                       background=self.colors["white"])
+        style.configure('CardName.TLabel',
+                       font=FONT_LABEL,
+                       foreground=self.colors["dark"],
+                       background=self.colors["white"])
     
     def export_data(self, format_type):
         """Export data in the specified format."""
-        export_content = self.generator.export_data(self.location_data, self.links, format_type)
-        
         # Get file extension
         extensions = {"json": ".json", "csv": ".csv", "txt": ".txt"}
         extension = extensions.get(format_type, ".txt")
@@ -592,9 +670,17 @@ class EnhancedShareableLinksGUI:
         )
         
         if filename:
+            # One timestamp per export click
+            timestamp = datetime.now().isoformat()
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(export_content)
+                if format_type == "csv":
+                    self.generator.write_csv(filename, self.links)
+                elif format_type == "json":
+                    self.generator.write_json(filename, self.location_data, self.links, timestamp=timestamp)
+                else:
+                    export_content = self.generator.export_data(self.location_data, self.links, format_type, timestamp=timestamp)
+                    with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
+                        f.write(export_content)
                 messagebox.showinfo("✅ Export Successful", f"Data exported to {filename}")
             except Exception as e:
                 messagebox.showerror("❌ Export Failed", f"Failed to export data: {str(e)}")
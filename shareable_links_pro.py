@@ -4,84 +4,126 @@ Professional Shareable Links Generator
 Enhanced GPS location sharing with modern UI design and professional styling.
 """
 
+from __future__ import annotations
+
 import urllib.parse
 import webbrowser
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-import time
+from tkinter import ttk
+from functools import partial, lru_cache
+from types import SimpleNamespace
+from collections.abc import Mapping
+from tk_helpers import LazyNotebook, Toast
+
+# Professional color scheme
+COLORS = SimpleNamespace(
+    primary="#2563eb",         # Blue
+    secondary="#64748b",       # Slate
+    success="#059669",         # Green
+    warning="#d97706",         # Orange
+    danger="#dc2626",          # Red
+    dark="#1e293b",            # Dark slate
+    light="#f8fafc",           # Light gray
+    white="#ffffff",           # White
+    accent="#7c3aed",          # Purple
+    gradient_start="#3b82f6",  # Blue gradient
+    gradient_end="#1d4ed8"     # Darker blue
+)
+
+@lru_cache(maxsize=256, typed=True)
+def _build_links(lat: float, lon: float, city_name: str, country: str, weather: str,
+                 temperature: float, traffic: str, speed: float) -> dict[str, str]:
+    """Build the links for one set of location fields; pure, so results are cached.
+    
+    The cache is typed because coord_compact prints lat/lon as passed in, so an
+    int and an equal float give different links.
+    """
+    # Create location description
+    location_desc = f"{city_name}, {country}"
+    location_desc_quoted = urllib.parse.quote(location_desc)
+    
+    # Fragments reused by several links, formatted once per call
+    coord_compact = f"{lat},{lon}"
+    coord_str = f"{lat:.6f}, {lon:.6f}"
+    temperature_str = f"{temperature:.1f}"
+    speed_str = f"{speed:.1f}"
+    
+    # Shared Google Maps link, formatted and percent-encoded once; it is
+    # passed as a query parameter, so safe="" encodes "/" as well. The URL is
+    # plain ASCII, so it goes straight to quote_from_bytes
+    maps_url = f"https://maps.google.com/?q={coord_compact}"
+    maps_url_quoted = urllib.parse.quote_from_bytes(maps_url.encode("ascii"), safe=b"")
+    
+    # Generate different types of shareable links
+    links = {
+        # Map Services
+        "google_maps": f"https://www.google.com/maps?q={coord_compact}",
+        "apple_maps": f"https://maps.apple.com/?q={coord_compact}",
+        "waze": f"https://waze.com/ul?ll={coord_compact}&navigate=yes",
+        "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
+        "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
+        
+        # Social Media
+        "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({coord_str})",
+        "telegram": f"https://t.me/share/url?url={maps_url_quoted}&text=📍 I'm at {location_desc}",
+        "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({coord_str})&url={maps_url_quoted}",
+        "facebook": f"https://www.facebook.com/sharer/sharer.php?u={maps_url_quoted}",
+        "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={maps_url_quoted}",
+        
+        # Communication
+        "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({coord_str})%0A%0AView on Google Maps: {maps_url}",
+        "sms": f"sms:?body=📍 I'm at {location_desc} ({coord_str})",
+        "deep_link": f"geo:{coord_compact}?q={location_desc_quoted}",
+        
+        # Custom Formats
+        "qr_code_data": maps_url,
+        "custom_share": "%0A".join([
+            f"📍 I'm at {location_desc} ({coord_str})",
+            "",
+            f"🌤️ Weather: {weather} | 🌡️ {temperature_str}°C",
+            f"🚦 Traffic: {traffic} | 🚗 {speed_str} km/h",
+            "",
+            f"🗺️ View on Google Maps: {maps_url}",
+        ]),
+        "short_text": f"📍 {location_desc} ({coord_str})",
+        "detailed_text": "%0A".join([
+            f"📍 Location: {location_desc}",
+            f"🌤️ Weather: {weather} | 🌡️ {temperature_str}°C",
+            f"🚦 Traffic: {traffic} | 🚗 {speed_str} km/h",
+            f"🗺️ Maps: {maps_url}",
+        ])
+    }
+    
+    return links
 
 class ProfessionalShareableLinksGenerator:
-    def __init__(self):
-        """Initialize the professional shareable links generator."""
-        self.supported_platforms = {
-            "maps": ["Google Maps", "Apple Maps", "Waze", "Bing Maps", "OpenStreetMap"],
-            "social": ["WhatsApp", "Telegram", "Twitter", "Facebook", "LinkedIn"],
-            "communication": ["Email", "SMS", "Deep Link"],
-            "custom": ["Custom Text", "QR Code Data", "Short Link"]
-        }
-        
-        # Professional color scheme
-        self.colors = {
-            "primary": "#2563eb",      # Blue
-            "secondary": "#64748b",     # Slate
-            "success": "#059669",       # Green
-            "warning": "#d97706",       # Orange
-            "danger": "#dc2626",        # Red
-            "dark": "#1e293b",          # Dark slate
-            "light": "#f8fafc",         # Light gray
-            "white": "#ffffff",         # White
-            "accent": "#7c3aed",        # Purple
-            "gradient_start": "#3b82f6", # Blue gradient
-            "gradient_end": "#1d4ed8"   # Darker blue
-        }
+    # Constant data, shared by every instance rather than rebuilt per generator
+    supported_platforms = {
+        "maps": ["Google Maps", "Apple Maps", "Waze", "Bing Maps", "OpenStreetMap"],
+        "social": ["WhatsApp", "Telegram", "Twitter", "Facebook", "LinkedIn"],
+        "communication": ["Email", "SMS", "Deep Link"],
+        "custom": ["Custom Text", "QR Code Data", "Short Link"]
+    }
+    
+    # Professional color scheme, shared module-wide
+    colors = COLORS
     
-    def generate_links(self, location):
+    def generate_links(self, location: Mapping[str, float | str]) -> dict[str, str]:
         """Generate comprehensive shareable links for a location."""
-        lat, lon = location["lat"], location["lon"]
-        city_name = location["name"]
-        country = location["country"]
-        weather = location.get("weather", "Unknown")
-        temperature = location.get("temperature", 0)
-        traffic = location.get("traffic", "Unknown")
-        speed = location.get("speed", 0)
-        
-        # Create location description
-        location_desc = f"{city_name}, {country}"
-        
-        # Generate different types of shareable links
-        links = {
-            # Map Services
-            "google_maps": f"https://www.google.com/maps?q={lat},{lon}",
-            "apple_maps": f"https://maps.apple.com/?q={lat},{lon}",
-            "waze": f"https://waze.com/ul?ll={lat},{lon}&navigate=yes",
-            "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lon}&lvl=15",
-            "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}&zoom=15",
-            
-            # Social Media
-            "whatsapp": f"https://wa.me/?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "telegram": f"https://t.me/share/url?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}&text=📍 I'm at {location_desc}",
-            "twitter": f"https://twitter.com/intent/tweet?text=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})&url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "facebook": f"https://www.facebook.com/sharer/sharer.php?u={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            "linkedin": f"https://www.linkedin.com/sharing/share-offsite/?url={urllib.parse.quote(f'https://maps.google.com/?q={lat},{lon}')}",
-            
-            # Communication
-            "email": f"mailto:?subject=📍 My Location&body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0AView on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "sms": f"sms:?body=📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})",
-            "deep_link": f"geo:{lat},{lon}?q={urllib.parse.quote(location_desc)}",
-            
-            # Custom Formats
-            "qr_code_data": f"https://maps.google.com/?q={lat},{lon}",
-            "custom_share": f"📍 I'm at {location_desc} ({lat:.6f}, {lon:.6f})%0A%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A%0A🗺️ View on Google Maps: https://maps.google.com/?q={lat},{lon}",
-            "short_text": f"📍 {location_desc} ({lat:.6f}, {lon:.6f})",
-            "detailed_text": f"📍 Location: {location_desc}%0A🌤️ Weather: {weather} | 🌡️ {temperature:.1f}°C%0A🚦 Traffic: {traffic} | 🚗 {speed:.1f} km/h%0A🗺️ Maps: https://maps.google.com/?q={lat},{lon}"
-        }
-        
-        return links
+        # Copied so callers can't modify the cached dict
+        return dict(_build_links(
+            location["lat"], location["lon"], location["name"], location["country"],
+            location.get("weather", "Unknown"), location.get("temperature", 0),
+            location.get("traffic", "Unknown"), location.get("speed", 0)
+        ))
     
     def open_link(self, url):
-        """Open a link in the default browser."""
+        """Open a link in the default browser without blocking the caller."""
         try:
-            webbrowser.open(url)
+            # Resolving the browser can take a while, so keep it off the Tk thread
+            opener = threading.Thread(target=webbrowser.open, args=(url,), daemon=True)
+            opener.start()
             return True
         except Exception as e:
             print(f"Error opening link: {e}")
@@ -97,36 +139,63 @@ class ProfessionalShareableLinksGenerator:
             print(f"Error copying to clipboard: {e}")
             return False
 
+# The generator holds no per-GUI state, so every GUI shares this one
+_GENERATOR = ProfessionalShareableLinksGenerator()
+
 class ProfessionalShareableLinksGUI:
+    # Link notebook tabs: (tab title, header, ((name, links key, icon, color), ...))
+    _LINK_TABS = (
+        ("🗺️ Maps", "🗺️ Map Services", (
+            ("Google Maps", "google_maps", "🌐", COLORS.primary),
+            ("Apple Maps", "apple_maps", "🍎", COLORS.secondary),
+            ("Waze", "waze", "🚗", COLORS.accent),
+            ("Bing Maps", "bing_maps", "🔍", COLORS.warning),
+            ("OpenStreetMap", "openstreetmap", "🗺️", COLORS.success)
+        )),
+        ("📱 Social", "📱 Social Media", (
+            ("WhatsApp", "whatsapp", "💬", "#25D366"),
+            ("Telegram", "telegram", "📱", "#0088cc"),
+            ("Twitter", "twitter", "🐦", "#1DA1F2"),
+            ("Facebook", "facebook", "📘", "#1877F2"),
+            ("LinkedIn", "linkedin", "💼", "#0A66C2")
+        )),
+        ("📧 Communication", "📧 Communication Tools", (
+            ("Email", "email", "📧", COLORS.primary),
+            ("SMS", "sms", "💬", COLORS.success),
+            ("Deep Link", "deep_link", "🔗", COLORS.accent)
+        ))
+    )
+    
     def __init__(self, root, location_data):
         self.root = root
         self.location_data = location_data
-        self.generator = ProfessionalShareableLinksGenerator()
+        self.generator = _GENERATOR
         self.links = self.generator.generate_links(location_data)
-        self.colors = self.generator.colors
+        self.button_styles = {}  # base color -> ttk button style name
         
-        self.setup_gui()
+        # Styles first: the theme switch would discard styles configured before it
+        self.style = ttk.Style()
         self.apply_styles()
+        self.setup_gui()
     
     def setup_gui(self):
         """Setup the professional shareable links GUI."""
         # Main window setup
         self.root.title("🔗 Professional Location Sharing")
-        self.root.geometry("1000x800")
-        self.root.configure(bg=self.colors["dark"])
+        self.root.configure(bg=COLORS.dark)
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         
         # Main frame with gradient effect
-        main_frame = tk.Frame(self.root, bg=self.colors["dark"])
+        main_frame = tk.Frame(self.root, bg=COLORS.dark)
         main_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(2, weight=1)
         
         # Header with gradient effect
-        header_frame = tk.Frame(main_frame, bg=self.colors["gradient_start"], height=80)
+        header_frame = tk.Frame(main_frame, bg=COLORS.gradient_start, height=80)
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         header_frame.grid_propagate(False)
         
@@ -134,8 +203,8 @@ class ProfessionalShareableLinksGUI:
         title_label = tk.Label(header_frame, 
                               text="🔗 Professional Location Sharing",
                               font=("Segoe UI", 24, "bold"),
-                              fg=self.colors["white"],
-                              bg=self.colors["gradient_start"])
+                              fg=COLORS.white,
+                              bg=COLORS.gradient_start)
         title_label.pack(expand=True)
         
         # Location info card
@@ -145,32 +214,37 @@ class ProfessionalShareableLinksGUI:
         notebook = ttk.Notebook(main_frame)
         notebook.grid(row=2, column=0, sticky="nsew", pady=(20, 0))
         
-        # Maps tab
-        self.create_maps_tab(notebook)
-        
-        # Social Media tab
-        self.create_social_tab(notebook)
-        
-        # Communication tab
-        self.create_communication_tab(notebook)
-        
-        # Custom tab
-        self.create_custom_tab(notebook)
+        # Tabs start empty and are filled the first time they are selected
+        tabs = LazyNotebook(notebook)
+        for title, header, entries in self._LINK_TABS:
+            tabs.add(tk.Frame(notebook, bg=COLORS.light), title,
+                     partial(self.create_link_tab, header=header, entries=entries))
+        tabs.add(tk.Frame(notebook, bg=COLORS.light), "📤 Custom", self.create_custom_tab)
+        tabs.build_selected()
         
         # Quick actions
         self.create_quick_actions(main_frame)
+        
+        # Non-modal feedback for open/copy actions
+        toast_label = tk.Label(main_frame, text="",
+                               font=("Segoe UI", 10, "bold"),
+                               bg=COLORS.dark)
+        toast_label.grid(row=4, column=0, pady=(10, 0))
+        self.toast = Toast(toast_label)
+        
+        # Sized last, once every widget exists, so the window manager resizes once
+        self.root.geometry("1000x800")
     
     def create_location_card(self, parent):
         """Create a professional location info card."""
-        card_frame = tk.Frame(parent, bg=self.colors["white"], relief="raised", bd=2)
-        card_frame.grid(row=1, column=0, sticky="ew", pady=(0, 20))
+        card_frame = tk.Frame(parent, bg=COLORS.white, relief="raised", bd=2)
         
         # Card header
         header_label = tk.Label(card_frame, 
                                text="📍 Current Location",
                                font=("Segoe UI", 16, "bold"),
-                               fg=self.colors["dark"],
-                               bg=self.colors["white"])
+                               fg=COLORS.dark,
+                               bg=COLORS.white)
         header_label.pack(pady=(15, 10))
         
         # Location details
@@ -180,293 +254,249 @@ class ProfessionalShareableLinksGUI:
         city_label = tk.Label(card_frame,
                              text=f"🌍 {location['name']}, {location['country']}",
                              font=("Segoe UI", 14, "bold"),
-                             fg=self.colors["primary"],
-                             bg=self.colors["white"])
+                             fg=COLORS.primary,
+                             bg=COLORS.white)
         city_label.pack(pady=2)
         
         # Coordinates
         coords_label = tk.Label(card_frame,
                                text=f"📍 {location['lat']:.6f}, {location['lon']:.6f}",
                                font=("Segoe UI", 12),
-                               fg=self.colors["secondary"],
-                               bg=self.colors["white"])
+                               fg=COLORS.secondary,
+                               bg=COLORS.white)
         coords_label.pack(pady=2)
         
         # Weather and traffic info
-        weather_frame = tk.Frame(card_frame, bg=self.colors["white"])
+        weather_frame = tk.Frame(card_frame, bg=COLORS.white)
         weather_frame.pack(pady=10)
         
         weather_label = tk.Label(weather_frame,
                                 text=f"🌤️ {location.get('weather', 'Unknown')} | 🌡️ {location.get('temperature', 0):.1f}°C",
                                 font=("Segoe UI", 11),
-                                fg=self.colors["success"],
-                                bg=self.colors["white"])
+                                fg=COLORS.success,
+                                bg=COLORS.white)
         weather_label.pack(side=tk.LEFT, padx=(0, 20))
         
         traffic_label = tk.Label(weather_frame,
                                 text=f"🚦 {location.get('traffic', 'Unknown')} | 🚗 {location.get('speed', 0):.1f} km/h",
                                 font=("Segoe UI", 11),
-                                fg=self.colors["warning"],
-                                bg=self.colors["white"])
+                                fg=COLORS.warning,
+                                bg=COLORS.white)
         traffic_label.pack(side=tk.LEFT)
         
         # Bottom padding
-        tk.Label(card_frame, bg=self.colors["white"]).pack(pady=15)
-    
-    def create_maps_tab(self, notebook):
-        """Create the maps tab with professional styling."""
-        maps_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(maps_frame, text="🗺️ Maps")
-        
-        # Tab header
-        header_label = tk.Label(maps_frame,
-                               text="🗺️ Map Services",
-                               font=("Segoe UI", 16, "bold"),
-                               fg=self.colors["dark"],
-                               bg=self.colors["light"])
-        header_label.pack(pady=(20, 15))
-        
-        maps_links = [
-            ("Google Maps", self.links["google_maps"], "🌐", self.colors["primary"]),
-            ("Apple Maps", self.links["apple_maps"], "🍎", self.colors["secondary"]),
-            ("Waze", self.links["waze"], "🚗", self.colors["accent"]),
-            ("Bing Maps", self.links["bing_maps"], "🔍", self.colors["warning"]),
-            ("OpenStreetMap", self.links["openstreetmap"], "🗺️", self.colors["success"])
-        ]
+        tk.Label(card_frame, bg=COLORS.white).pack(pady=15)
         
-        for name, url, icon, color in maps_links:
-            self.create_link_card(maps_frame, name, url, icon, color)
+        # Gridded only once filled, so the card is laid out in one pass
+        card_frame.grid(row=1, column=0, sticky="ew", pady=(0, 20))
     
-    def create_social_tab(self, notebook):
-        """Create the social media tab."""
-        social_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(social_frame, text="📱 Social")
-        
-        # Tab header
-        header_label = tk.Label(social_frame,
-                               text="📱 Social Media",
+    def create_tab_header(self, frame, text):
+        """Add the heading label at the top of a tab."""
+        header_label = tk.Label(frame,
+                               text=text,
                                font=("Segoe UI", 16, "bold"),
-                               fg=self.colors["dark"],
-                               bg=self.colors["light"])
+                               fg=COLORS.dark,
+                               bg=COLORS.light)
         header_label.pack(pady=(20, 15))
-        
-        social_links = [
-            ("WhatsApp", self.links["whatsapp"], "💬", "#25D366"),
-            ("Telegram", self.links["telegram"], "📱", "#0088cc"),
-            ("Twitter", self.links["twitter"], "🐦", "#1DA1F2"),
-            ("Facebook", self.links["facebook"], "📘", "#1877F2"),
-            ("LinkedIn", self.links["linkedin"], "💼", "#0A66C2")
-        ]
-        
-        for name, url, icon, color in social_links:
-            self.create_link_card(social_frame, name, url, icon, color)
     
-    def create_communication_tab(self, notebook):
-        """Create the communication tab."""
-        comm_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(comm_frame, text="📧 Communication")
-        
-        # Tab header
-        header_label = tk.Label(comm_frame,
-                               text="📧 Communication Tools",
-                               font=("Segoe UI", 16, "bold"),
-                               fg=self.colors["dark"],
-                               bg=self.colors["light"])
-        header_label.pack(pady=(20, 15))
-        
-        comm_links = [
-            ("Email", self.links["email"], "📧", self.colors["primary"]),
-            ("SMS", self.links["sms"], "💬", self.colors["success"]),
-            ("Deep Link", self.links["deep_link"], "🔗", self.colors["accent"])
-        ]
-        
-        for name, url, icon, color in comm_links:
-            self.create_link_card(comm_frame, name, url, icon, color)
+    def create_link_tab(self, frame, header, entries):
+        """Fill a link tab with its header and one card per (name, links key, icon, color)."""
+        self.create_tab_header(frame, header)
+        links = self.links
+        self.create_link_cards(frame, [(name, links[key], icon, color)
+                                       for name, key, icon, color in entries])
     
-    def create_custom_tab(self, notebook):
+    def create_custom_tab(self, custom_frame):
         """Create the custom sharing tab."""
-        custom_frame = tk.Frame(notebook, bg=self.colors["light"])
-        notebook.add(custom_frame, text="📤 Custom")
-        
-        # Tab header
-        header_label = tk.Label(custom_frame,
-                               text="📤 Custom Sharing",
-                               font=("Segoe UI", 16, "bold"),
-                               fg=self.colors["dark"],
-                               bg=self.colors["light"])
-        header_label.pack(pady=(20, 15))
+        self.create_tab_header(custom_frame, "📤 Custom Sharing")
         
         # Custom share text area
-        text_frame = tk.Frame(custom_frame, bg=self.colors["white"], relief="solid", bd=1)
+        text_frame = tk.Frame(custom_frame, bg=COLORS.white, relief="solid", bd=1)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        custom_text = tk.Text(text_frame, 
-                             height=8, 
-                             width=70,
-                             font=("Consolas", 10),
-                             bg=self.colors["white"],
-                             fg=self.colors["dark"],
-                             relief="flat",
-                             padx=10,
-                             pady=10)
-        custom_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        custom_text.insert(tk.END, self.links["custom_share"])
+        # Read-only preview, with the encoded line breaks shown as real ones
+        preview = tk.Label(text_frame,
+                          text=self.links["custom_share"].replace("%0A", "\n"),
+                          font=("Consolas", 10),
+                          bg=COLORS.white,
+                          fg=COLORS.dark,
+                          justify="left",
+                          anchor="nw",
+                          wraplength=700,
+                          padx=10,
+                          pady=10)
+        preview.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Buttons for custom share
-        custom_buttons = tk.Frame(custom_frame, bg=self.colors["light"])
+        custom_buttons = tk.Frame(custom_frame, bg=COLORS.light)
         custom_buttons.pack(pady=15)
         
         self.create_professional_button(custom_buttons, "📋 Copy Text", 
-                                      lambda: self.copy_text(custom_text.get(1.0, tk.END).strip()),
-                                      self.colors["primary"])
+                                      partial(self.copy_text, self.links["custom_share"]),
+                                      COLORS.primary)
         
         self.create_professional_button(custom_buttons, "🔗 Copy Google Maps Link", 
-                                      lambda: self.copy_link(self.links["google_maps"]),
-                                      self.colors["success"])
+                                      partial(self.copy_link, self.links["google_maps"]),
+                                      COLORS.success)
         
         self.create_professional_button(custom_buttons, "📱 Copy QR Code Data", 
-                                      lambda: self.copy_link(self.links["qr_code_data"]),
-                                      self.colors["accent"])
+                                      partial(self.copy_link, self.links["qr_code_data"]),
+                                      COLORS.accent)
         
         # Additional custom formats
         formats_frame = tk.LabelFrame(custom_frame, text="📝 Custom Formats", 
                                      font=("Segoe UI", 12, "bold"),
-                                     bg=self.colors["light"],
-                                     fg=self.colors["dark"])
+                                     bg=COLORS.light,
+                                     fg=COLORS.dark)
         formats_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        formats_buttons = tk.Frame(formats_frame, bg=self.colors["light"])
+        formats_buttons = tk.Frame(formats_frame, bg=COLORS.light)
         formats_buttons.pack(pady=10)
         
         self.create_professional_button(formats_buttons, "📋 Short Text", 
-                                      lambda: self.copy_text(self.links["short_text"]),
-                                      self.colors["primary"])
+                                      partial(self.copy_text, self.links["short_text"]),
+                                      COLORS.primary)
         
         self.create_professional_button(formats_buttons, "📋 Detailed Text", 
-                                      lambda: self.copy_text(self.links["detailed_text"]),
-                                      self.colors["success"])
+                                      partial(self.copy_text, self.links["detailed_text"]),
+                                      COLORS.success)
         
         self.create_professional_button(formats_buttons, "📋 Coordinates Only", 
-                                      lambda: self.copy_text(f"{self.location_data['lat']:.6f}, {self.location_data['lon']:.6f}"),
-                                      self.colors["warning"])
+                                      partial(self.copy_text, f"{self.location_data['lat']:.6f}, {self.location_data['lon']:.6f}"),
+                                      COLORS.warning)
+    
+    def create_link_cards(self, parent, entries):
+        """Add a card per (name, url, icon, color) entry, packing their container once filled."""
+        # The container is only mapped after all cards exist, so it is laid out once
+        container = tk.Frame(parent, bg=COLORS.light)
+        for name, url, icon, color in entries:
+            self.create_link_card(container, name, url, icon, color)
+        container.pack(fill=tk.X)
     
     def create_link_card(self, parent, name, url, icon, color):
         """Create a professional link card."""
         card_frame = tk.Frame(parent, 
-                             bg=self.colors["white"], 
+                             bg=COLORS.white, 
                              relief="solid", 
                              bd=1)
         card_frame.pack(fill=tk.X, padx=20, pady=5)
         
         # Card content
-        content_frame = tk.Frame(card_frame, bg=self.colors["white"])
+        content_frame = tk.Frame(card_frame, bg=COLORS.white)
         content_frame.pack(fill=tk.X, padx=15, pady=10)
         
         # Icon and name
         icon_label = tk.Label(content_frame,
                              text=icon,
                              font=("Segoe UI", 16),
-                             bg=self.colors["white"])
+                             bg=COLORS.white)
         icon_label.pack(side=tk.LEFT)
         
         name_label = tk.Label(content_frame,
                              text=name,
                              font=("Segoe UI", 12, "bold"),
-                             fg=self.colors["dark"],
-                             bg=self.colors["white"])
+                             fg=COLORS.dark,
+                             bg=COLORS.white)
         name_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # Buttons
-        button_frame = tk.Frame(content_frame, bg=self.colors["white"])
+        button_frame = tk.Frame(content_frame, bg=COLORS.white)
         button_frame.pack(side=tk.RIGHT)
         
         self.create_professional_button(button_frame, "🔗 Open", 
-                                      lambda: self.open_link(url),
+                                      partial(self.open_link, url),
                                       color)
         
         self.create_professional_button(button_frame, "📋 Copy", 
-                                      lambda: self.copy_link(url),
-                                      self.colors["secondary"])
+                                      partial(self.copy_link, url),
+                                      COLORS.secondary)
     
     def create_professional_button(self, parent, text, command, color):
         """Create a professional styled button."""
-        button = tk.Button(parent,
-                          text=text,
-                          command=command,
-                          font=("Segoe UI", 10, "bold"),
-                          fg=self.colors["white"],
-                          bg=color,
-                          relief="flat",
-                          padx=15,
-                          pady=5,
-                          cursor="hand2")
+        button = ttk.Button(parent,
+                           text=text,
+                           command=command,
+                           style=self.button_style(color),
+                           cursor="hand2")
         button.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Hover effects
-        button.bind("<Enter>", lambda e: button.configure(bg=self.lighten_color(color)))
-        button.bind("<Leave>", lambda e: button.configure(bg=color))
-        
         return button
     
+    def button_style(self, color):
+        """Name of the ttk button style for a base color, configuring it on first use."""
+        name = self.button_styles.get(color)
+        if name is None:
+            # Named after the color: ttk styles are shared by every window on the interpreter
+            name = self.button_styles[color] = f"Pro{color.lstrip('#')}.TButton"
+            self.style.configure(name,
+                                 font=("Segoe UI", 10, "bold"),
+                                 foreground=COLORS.white,
+                                 background=color,
+                                 relief="flat",
+                                 borderwidth=0,
+                                 padding=(15, 5))
+            # Hover color handled by Tk through the active state
+            self.style.map(name, background=[('active', self.lighten_color(color))])
+        return name
+    
     def lighten_color(self, color):
         """Lighten a color for hover effects."""
-        # Simple color lightening for hover effect
+        # Add 30 to each channel, saturating at 255, from a single hex parse
         if color.startswith("#"):
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            r = min(255, r + 30)
-            g = min(255, g + 30)
-            b = min(255, b + 30)
-            return f"#{r:02x}{g:02x}{b:02x}"
+            v = int(color[1:], 16)
+            r, g, b = v >> 16, (v >> 8) & 0xFF, v & 0xFF
+            r = r + 30 if r < 226 else 255
+            g = g + 30 if g < 226 else 255
+            b = b + 30 if b < 226 else 255
+            return "#%06x" % ((r << 16) | (g << 8) | b)
         return color
     
     def create_quick_actions(self, parent):
         """Create professional quick action buttons."""
-        quick_frame = tk.Frame(parent, bg=self.colors["dark"])
+        quick_frame = tk.Frame(parent, bg=COLORS.dark)
         quick_frame.grid(row=3, column=0, sticky="ew", pady=(20, 0))
         
         # Quick actions header
         header_label = tk.Label(quick_frame,
                                text="⚡ Quick Actions",
                                font=("Segoe UI", 14, "bold"),
-                               fg=self.colors["white"],
-                               bg=self.colors["dark"])
+                               fg=COLORS.white,
+                               bg=COLORS.dark)
         header_label.pack(pady=(0, 15))
         
         # Quick action buttons
-        actions_frame = tk.Frame(quick_frame, bg=self.colors["dark"])
+        actions_frame = tk.Frame(quick_frame, bg=COLORS.dark)
         actions_frame.pack()
         
         quick_actions = [
-            ("🗺️ Open Google Maps", self.links["google_maps"], self.colors["primary"]),
+            ("🗺️ Open Google Maps", self.links["google_maps"], COLORS.primary),
             ("💬 Share on WhatsApp", self.links["whatsapp"], "#25D366"),
             ("📱 Share on Telegram", self.links["telegram"], "#0088cc"),
-            ("📧 Send Email", self.links["email"], self.colors["success"])
+            ("📧 Send Email", self.links["email"], COLORS.success)
         ]
         
         for text, url, color in quick_actions:
             self.create_professional_button(actions_frame, text, 
-                                          lambda u=url: self.open_link(u), color)
+                                          partial(self.open_link, url), color)
     
     def apply_styles(self):
         """Apply professional styles to the application."""
         # Configure ttk styles
-        style = ttk.Style()
+        style = self.style
         style.theme_use('clam')
         
         # Configure notebook style
         style.configure('TNotebook', 
-                       background=self.colors["light"],
+                       background=COLORS.light,
                        borderwidth=0)
         style.configure('TNotebook.Tab', 
                        padding=[20, 10],
                        font=('Segoe UI', 10, 'bold'))
         style.map('TNotebook.Tab',
-                 background=[('selected', self.colors["primary"]),
-                           ('active', self.colors["secondary"])],
-                 foreground=[('selected', self.colors["white"]),
-                           ('active', self.colors["white"])])
+                 background=[('selected', COLORS.primary),
+                           ('active', COLORS.secondary)],
+                 foreground=[('selected', COLORS.white),
+                           ('active', COLORS.white)])
     
     def open_link(self, url):
         """Open a link in the browser with professional feedback."""
@@ -491,11 +521,11 @@ class ProfessionalShareableLinksGUI:
     
     def show_success_message(self, message):
         """Show a professional success message."""
-        messagebox.showinfo("✅ Success", message)
+        self.toast.show(f"✅ {message}", fg=COLORS.success)
     
     def show_error_message(self, message):
         """Show a professional error message."""
-        messagebox.showerror("❌ Error", message)
+        self.toast.show(f"❌ {message}", fg=COLORS.danger)
 
 def demo_professional_shareable_links():
     """Demo function to test professional shareable links."""
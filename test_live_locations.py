@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the Live Location Tracker's stop/start handling.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from live_locations import LiveLocationTracker
+
+class StopStartTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = LiveLocationTracker()
+        fd, self.tracker.log_file = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+    
+    def tearDown(self):
+        self.tracker.stop_tracking()
+        self.tracker.close()
+        os.remove(self.tracker.log_file)
+    
+    def test_restart_waits_for_next_tick(self):
+        """stop then start records one fix and then waits out the interval."""
+        self.tracker.tracking_interval = 2.0
+        self.tracker.stop_tracking()
+        self.tracker.start_tracking()
+        time.sleep(0.3)
+        self.assertEqual(len(self.tracker.location_history), 1)
+    
+    def test_reset_stop_rearms_wait(self):
+        """A loop started outside start_tracking (as the GUI does) waits after reset_stop."""
+        self.tracker.stop_tracking()
+        self.tracker.reset_stop()
+        start = time.monotonic()
+        self.tracker.wait_for_tick(0.2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tk Helpers
+Small widget helpers shared by the location tracker and shareable links GUIs.
+"""
+
+class LazyNotebook:
+    """Notebook whose tabs are filled by builder(frame) the first time each is selected."""
+    
+    def __init__(self, notebook):
+        self.notebook = notebook
+        self.builders = {}  # tab frame path -> builder that has not run yet
+        notebook.bind("<<NotebookTabChanged>>", self.build_selected)
+    
+    def add(self, frame, title, builder):
+        """Add frame as an empty tab; builder(frame) fills it on first selection."""
+        self.notebook.add(frame, text=title)
+        self.builders[str(frame)] = builder
+    
+    def build_selected(self, event=None):
+        """Fill the selected tab if it has not been built yet."""
+        selected = str(self.notebook.select())
+        builder = self.builders.pop(selected, None)
+        if builder:
+            builder(self.notebook.nametowidget(selected))
+
+class Toast:
+    """Shows one short message at a time in a label and clears it after a delay."""
+    
+    def __init__(self, label, duration_ms=1500):
+        self.label = label
+        self.duration_ms = duration_ms
+        self.job = None  # pending after() id that clears the message
+    
+    def show(self, message, **options):
+        """Replace the current message; options (e.g. fg) go to the label's config."""
+        self.label.config(text=message, **options)
+        if self.job is not None:
+            self.label.after_cancel(self.job)
+        self.job = self.label.after(self.duration_ms, self.clear)
+    
+    def clear(self):
+        """Hide the message."""
+        self.job = None
+        self.label.config(text="")